@@ -1,3 +1,38 @@
+from importlib import import_module
+# Local imports
 from .polymorphic_list import PolymorphicList, NonEmptyList, EmptyList
 
-__version__ = "1.0.0"
\ No newline at end of file
+__version__ = "1.0.0"
+
+__all__ = ["PolymorphicList", "NonEmptyList", "EmptyList"]
+
+# Optional components, only imported when first accessed so that importing the
+# package stays cheap. Maps an attribute to its module and the name in that
+# module, or None for the module itself.
+_LAZY_ATTRIBUTES = {
+    "NodePool": (".node_pool", "NodePool"),
+    "UnrolledList": (".unrolled_list", "UnrolledList"),
+    "instrumentation": (".instrumentation", None),
+    "streaming": (".streaming", None),
+}
+
+
+def __getattr__(name: str):
+    """Imports the optional components on first access.
+
+    Raises:
+        AttributeError: raised if the package has no attribute `name`
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = import_module(module_name, __name__)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
\ No newline at end of file
@@ -0,0 +1,7 @@
+"""Performance benchmarks for the PolymorphicList implementations.
+
+Run `python -m py_polymorphic_list.bench --help` for usage.
+"""
+from .backends import BACKENDS, Backend, register_backend
+from .operations import OPERATIONS, Operation
+from .runner import compare, run_benchmarks, scaling_exponent
@@ -0,0 +1,87 @@
+"""Benchmarks every PolymorphicList operation across list sizes.
+
+Prints ops/sec, peak memory and scaling exponents, optionally writes them to a JSON
+file, and optionally compares them against a stored baseline. Exits with status 1 if
+any result regressed by more than the tolerance.
+
+Usage:
+    python -m py_polymorphic_list.bench [--output results.json] [--baseline baseline.json]
+"""
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional
+# Local imports
+from .backends import BACKENDS
+from .operations import OPERATIONS
+from .runner import compare, run_benchmarks
+
+
+def _print_report(report: Dict) -> None:
+    """Prints the results and scaling exponents of a report as tables."""
+    print(f"{'backend':<14} {'operation':<24} {'size':>8} "
+          f"{'ops/sec':>14} {'peak bytes':>12}")
+    for r in report["results"]:
+        print(f"{r['backend']:<14} {r['operation']:<24} {r['size']:>8} "
+              f"{r['ops_per_sec']:>14,.0f} {r['peak_bytes']:>12,}")
+    print()
+    print(f"{'backend':<14} {'operation':<24} {'exponent':>8}")
+    for s in report["scaling"]:
+        print(f"{s['backend']:<14} {s['operation']:<24} "
+              f"{s['exponent']:>8.2f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m py_polymorphic_list.bench",
+        description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", action="append", choices=BACKENDS,
+                        help="backend to benchmark (default: all)")
+    parser.add_argument("--operation", action="append", choices=OPERATIONS,
+                        help="operation to benchmark (default: all)")
+    parser.add_argument("--sizes", type=lambda s: [int(n) for n in s.split(",")],
+                        help="comma separated list sizes (default: 10, 30, 100, ...)")
+    parser.add_argument("--max-size", type=int, default=100_000,
+                        help="largest default size for non-recursive backends")
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="minimum seconds per measurement")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="measurements per result, the fastest is kept")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed slowdown against the baseline (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        [BACKENDS[name] for name in args.backend or BACKENDS],
+        [OPERATIONS[name] for name in args.operation or OPERATIONS],
+        sizes=args.sizes,
+        max_size=args.max_size,
+        min_time=args.min_time,
+        repeat=args.repeat,
+    )
+    _print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        print()
+        if not regressions:
+            print(f"No regressions against {args.baseline}")
+            return 0
+        print(f"{len(regressions)} regression(s) against {args.baseline}:")
+        for r in regressions:
+            print(f"{r['backend']:<14} {r['operation']:<24} {r['size']:>8} "
+                  f"{r['change']:>+8.1%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+from typing import Any, Callable, Dict, List, NamedTuple
+# Local imports
+from ..polymorphic_list import EmptyList
+from ..unrolled_list import UnrolledList
+
+
+class Backend(NamedTuple):
+    """A PolymorphicList implementation that the benchmarks can run against.
+
+    Args:
+        name (str): The name used to select the backend and label its results.
+        build (Callable[[List], Any]): Builds a list of the backend holding the given elements.
+        recursive (bool): Whether the backend's methods recurse once per element,
+            which caps the benchmarked sizes below the recursion limit.
+    """
+    name: str
+    build: Callable[[List], Any]
+    recursive: bool
+
+
+def _build_polymorphic_list(elements: List) -> Any:
+    """Builds a NonEmptyList/EmptyList chain holding the given elements.
+
+    Args:
+        elements (List): The elements of the list, in order.
+
+    Returns:
+        Union[NonEmptyList, EmptyList]: The head of the new list.
+    """
+    lst = EmptyList()
+    for element in reversed(elements):
+        lst = lst.prepend(element)
+    return lst
+
+
+BACKENDS: Dict[str, Backend] = {}
+
+
+def register_backend(backend: Backend) -> None:
+    """Makes a backend available to the benchmarks.
+
+    Args:
+        backend (Backend): The backend to register.
+    """
+    BACKENDS[backend.name] = backend
+
+
+register_backend(Backend("polymorphic", _build_polymorphic_list, True))
+register_backend(Backend("unrolled", UnrolledList, False))
@@ -0,0 +1,129 @@
+"""Benchmarks queue-like churn on a PolymorphicList with and without a NodePool.
+
+Reports sustained ops/sec and the number of collections run by each gc generation.
+
+Usage:
+    python -m py_polymorphic_list.bench.node_pool [--ops N] [--size N] [--burst N]
+        [--pool-size N]
+"""
+import argparse
+import gc
+import sys
+import time
+from typing import Callable, Dict, List
+
+from .. import EmptyList, NodePool
+
+
+def _prepend_remove_head(lst, burst: int, bursts: int):
+    """Pushes and pops bursts of elements at the head of the list, like a stack."""
+    for _ in range(bursts):
+        for i in range(burst):
+            lst = lst.prepend(i)
+        for _ in range(burst):
+            lst = lst.remove_head()
+    return lst
+
+
+def _append_remove_tail(lst, burst: int, bursts: int):
+    """Pushes and pops bursts of elements at the tail of the list."""
+    for _ in range(bursts):
+        for i in range(burst):
+            lst = lst.append(i)
+        for _ in range(burst):
+            lst = lst.remove_tail()
+    return lst
+
+
+def _prepend_remove_tail(lst, burst: int, bursts: int):
+    """Pushes bursts of elements at the head and pops them at the tail, like a queue."""
+    for _ in range(bursts):
+        for i in range(burst):
+            lst = lst.prepend(i)
+        for _ in range(burst):
+            lst = lst.remove_tail()
+    return lst
+
+
+WORKLOADS: Dict[str, Callable] = {
+    "prepend/remove_head": _prepend_remove_head,
+    "append/remove_tail": _append_remove_tail,
+    "prepend/remove_tail": _prepend_remove_tail,
+}
+
+
+def _gc_collections() -> List[int]:
+    """Finds the number of collections run so far by each gc generation."""
+    return [gen["collections"] for gen in gc.get_stats()]
+
+
+def run(workload: Callable, ops: int, size: int, burst: int,
+        pool_size: int) -> Dict:
+    """Runs a workload on a list of `size` elements, optionally with a NodePool.
+
+    Every burst keeps `burst` new nodes alive before dropping them again. Bursts larger
+    than the gc generation 0 threshold make the run allocate enough live objects to
+    trigger collections, which is the garbage a pool is meant to avoid.
+
+    Args:
+        workload (Callable): One of the WORKLOADS functions.
+        ops (int): The approximate number of push/pop pairs to run.
+        size (int): The number of elements kept in the list during the run.
+        burst (int): The number of elements pushed before they are popped again.
+        pool_size (int): The NodePool size, or 0 to run without a pool.
+
+    Returns:
+        Dict: ops/sec and per-generation gc collection counts for the run.
+    """
+    lst = EmptyList()
+    for i in range(size):
+        lst = lst.prepend(i)
+    bursts = max(ops // burst, 1)
+
+    # The tail operations recurse once per node
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(recursion_limit, size + burst + 100))
+    pool = NodePool(pool_size) if pool_size else None
+    if pool is not None:
+        pool.install()
+    try:
+        gc.collect()
+        before = _gc_collections()
+        start = time.perf_counter()
+        workload(lst, burst, bursts)
+        elapsed = time.perf_counter() - start
+        after = _gc_collections()
+    finally:
+        if pool is not None:
+            pool.uninstall()
+        sys.setrecursionlimit(recursion_limit)
+
+    return {
+        # Every push/pop pair counts as two operations
+        "ops_per_sec": 2 * burst * bursts / elapsed,
+        "gc_collections": [a - b for a, b in zip(after, before)],
+        "pool_hits": pool.hits if pool is not None else 0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--burst", type=int, default=2000)
+    parser.add_argument("--pool-size", type=int, default=4096)
+    args = parser.parse_args()
+
+    print(f"{'workload':<22} {'pool':>5} {'ops/sec':>12} "
+          f"{'gen0':>6} {'gen1':>6} {'gen2':>6} {'hits':>8}")
+    for name, workload in WORKLOADS.items():
+        for pool_size in (0, args.pool_size):
+            result = run(workload, args.ops, args.size, args.burst, pool_size)
+            gen0, gen1, gen2 = result["gc_collections"]
+            print(f"{name:<22} {'yes' if pool_size else 'no':>5} "
+                  f"{result['ops_per_sec']:>12,.0f} "
+                  f"{gen0:>6} {gen1:>6} {gen2:>6} {result['pool_hits']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+from copy import copy
+from typing import Any, Callable, Dict, List, NamedTuple
+
+
+class Operation(NamedTuple):
+    """A single benchmarked call on a list of `size` elements `0..size-1`.
+
+    Args:
+        name (str): The name used to select the operation and label its results.
+        run (Callable[[Any, int], Any]): Runs the operation on a list of the given size.
+        mutates (bool): Whether the operation changes the list, in which case every
+            timed call gets a freshly built list.
+        frames_per_element (int): Stack frames a recursive backend uses per element,
+            which lowers the largest size the operation can be benchmarked at.
+    """
+    name: str
+    run: Callable[[Any, int], Any]
+    mutates: bool
+    frames_per_element: int = 1
+
+
+def _sample(n: int) -> List[int]:
+    """Picks up to 32 indices, or elements, spread over a list of size n in descending order."""
+    return list(range(n - 1, -1, -max(1, n // 32)))
+
+
+# Operations that search the list look for its last element, the worst case.
+OPERATIONS: Dict[str, Operation] = {
+    op.name: op
+    for op in [
+        Operation("size", lambda lst, n: lst.size(), False),
+        Operation("append", lambda lst, n: lst.append(n), True),
+        Operation("prepend", lambda lst, n: lst.prepend(n), True),
+        Operation("insert", lambda lst, n: lst.insert(n, n // 2), True),
+        Operation("remove_head", lambda lst, n: lst.remove_head(), True),
+        Operation("remove_tail", lambda lst, n: lst.remove_tail(), True),
+        Operation("remove_element",
+                  lambda lst, n: lst.remove_element(n - 1), True),
+        Operation("remove_nth_occurrence",
+                  lambda lst, n: lst.remove_nth_occurrence(n - 1, 1), True),
+        Operation("remove_all_occurrences",
+                  lambda lst, n: lst.remove_all_occurrences(n - 1), True),
+        Operation("remove_index", lambda lst, n: lst.remove_index(n - 1),
+                  True),
+        Operation("get", lambda lst, n: lst.get(n - 1), False),
+        Operation("get_tail", lambda lst, n: lst.get_tail(), False),
+        Operation("get_nth_occurrence",
+                  lambda lst, n: lst.get_nth_occurrence(n - 1, 1), False),
+        Operation("index_of", lambda lst, n: lst.index_of(n - 1), False),
+        Operation("count_occurrences",
+                  lambda lst, n: lst.count_occurrences(n - 1), False),
+        Operation("__contains__", lambda lst, n: (n - 1) in lst, False),
+        # __add__ copies the other list from the bottom of its own recursion
+        Operation("__add__", lambda lst, n: lst + lst, False, 3),
+        Operation("__copy__", lambda lst, n: copy(lst), False),
+        Operation("__eq__", lambda lst, n: lst == lst, False, 2),
+        Operation("__str__", lambda lst, n: str(lst), False, 2),
+        Operation("get_many", lambda lst, n: lst.get_many(_sample(n)), False),
+        Operation("index_of_many",
+                  lambda lst, n: lst.index_of_many(_sample(n)), False),
+        Operation("contains_many",
+                  lambda lst, n: lst.contains_many(_sample(n)), False),
+        Operation("reverse", lambda lst, n: lst.reverse(), True),
+        Operation("rotate", lambda lst, n: lst.rotate(n // 3), True),
+        Operation("split_at", lambda lst, n: lst.split_at(n // 2), True),
+        Operation("take", lambda lst, n: lst.take(n // 2), True),
+        Operation("drop", lambda lst, n: lst.drop(n // 2), True),
+    ]
+}
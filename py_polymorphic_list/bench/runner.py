@@ -0,0 +1,242 @@
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Dict, Iterable, List, Optional, Sequence
+# Local imports
+from .. import __version__
+from .backends import Backend
+from .operations import Operation
+
+# Stack frames kept free for the benchmark itself when sizing recursive backends.
+RECURSION_HEADROOM = 100
+
+# The most lists, and the most elements across them, built up front for one
+# measurement of a mutating operation.
+MAX_MUTATING_BATCH = 1000
+MAX_MUTATING_BATCH_ELEMENTS = 1_000_000
+
+
+def max_size_for(backend: Backend, operation: Operation,
+                 max_size: int) -> int:
+    """Finds the largest size an operation can be benchmarked at on a backend.
+
+    Args:
+        backend (Backend): The backend to size.
+        operation (Operation): The operation to size.
+        max_size (int): The largest size for backends that don't recurse per element.
+
+    Returns:
+        int: `max_size`, or the largest size that stays below the recursion limit.
+    """
+    if not backend.recursive:
+        return max_size
+    frames = sys.getrecursionlimit() - RECURSION_HEADROOM
+    return min(max_size, frames // operation.frames_per_element)
+
+
+def default_sizes(limit: int) -> List[int]:
+    """Finds the list sizes to benchmark at: 10, 30, 100, 300, ... and finally `limit`.
+
+    Args:
+        limit (int): The largest size.
+
+    Returns:
+        List[int]: The increasing list sizes.
+    """
+    sizes = []
+    exponent = 1
+    while True:
+        for mantissa in (1, 3):
+            size = mantissa * 10**exponent
+            if size >= limit:
+                sizes.append(limit)
+                return sizes
+            sizes.append(size)
+        exponent += 1
+
+
+def time_operation(backend: Backend, operation: Operation, size: int,
+                   min_time: float, repeat: int) -> float:
+    """Times an operation on a list of the given size.
+
+    Args:
+        backend (Backend): The backend to build the list with.
+        operation (Operation): The operation to time.
+        size (int): The number of elements in the list.
+        min_time (float): The minimum number of seconds each measurement runs for.
+        repeat (int): The number of measurements; the fastest one is kept.
+
+    Returns:
+        float: The best time per call in seconds.
+    """
+    elements = list(range(size))
+    run = operation.run
+    timer = time.perf_counter
+    best = math.inf
+    max_batch = min(MAX_MUTATING_BATCH,
+                    max(MAX_MUTATING_BATCH_ELEMENTS // max(size, 1), 1))
+    for _ in range(repeat):
+        total, calls = 0.0, 0
+        if operation.mutates:
+            # Every call gets a fresh list. The batch is built before the timed loop,
+            # and grown until the loop runs for min_time or the batch is capped.
+            number = 1
+            while True:
+                lists = [backend.build(elements) for _ in range(number)]
+                start = timer()
+                for lst in lists:
+                    run(lst, size)
+                total = timer() - start
+                calls = number
+                del lists
+                if total >= min_time or number >= max_batch:
+                    break
+                estimate = math.ceil(number * min_time / max(total, 1e-9))
+                number = min(max(estimate, 2 * number), max_batch)
+        else:
+            lst = backend.build(elements)
+            number = 1
+            while total < min_time:
+                start = timer()
+                for _ in range(number):
+                    run(lst, size)
+                total += timer() - start
+                calls += number
+                number *= 2
+        best = min(best, total / calls)
+    return best
+
+
+def measure_peak_memory(backend: Backend, operation: Operation,
+                        size: int) -> int:
+    """Measures the peak memory allocated while running an operation once.
+
+    Args:
+        backend (Backend): The backend to build the list with.
+        operation (Operation): The operation to measure.
+        size (int): The number of elements in the list.
+
+    Returns:
+        int: The peak number of bytes allocated by the operation.
+    """
+    lst = backend.build(list(range(size)))
+    tracemalloc.start()
+    try:
+        result = operation.run(lst, size)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def scaling_exponent(sizes: Sequence[int], times: Sequence[float]) -> float:
+    """Fits time ~ size ** k by least squares on a log-log scale.
+
+    Args:
+        sizes (Sequence[int]): The benchmarked sizes.
+        times (Sequence[float]): The time per call at each size.
+
+    Returns:
+        float: The exponent k, e.g. ~0 for O(1) and ~1 for O(n) operations.
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(t) for t in times]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    var = sum((x - x_mean)**2 for x in xs)
+    if var == 0:
+        return 0.0
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / var
+
+
+def run_benchmarks(backends: Iterable[Backend],
+                   operations: Iterable[Operation],
+                   sizes: Optional[Sequence[int]] = None,
+                   max_size: int = 100_000,
+                   min_time: float = 0.05,
+                   repeat: int = 3) -> Dict:
+    """Benchmarks every operation on every backend across a range of sizes.
+
+    Args:
+        backends (Iterable[Backend]): The backends to benchmark.
+        operations (Iterable[Operation]): The operations to benchmark.
+        sizes (Optional[Sequence[int]]): The sizes to use; defaults to `default_sizes`.
+            Sizes too large for a recursive backend are skipped.
+        max_size (int): The largest default size for non-recursive backends.
+        min_time (float): The minimum number of seconds each measurement runs for.
+        repeat (int): The number of measurements per result; the fastest one is kept.
+
+    Returns:
+        Dict: A JSON serializable report with a `results` entry per backend, operation and size,
+        and a `scaling` entry per backend and operation.
+    """
+    operations = list(operations)
+    results = []
+    scaling = []
+    for backend in backends:
+        for operation in operations:
+            if sizes is None:
+                op_sizes = default_sizes(
+                    max_size_for(backend, operation, max_size))
+            else:
+                limit = max_size_for(backend, operation, max(sizes))
+                op_sizes = [size for size in sizes if size <= limit]
+            times = []
+            for size in op_sizes:
+                seconds = time_operation(backend, operation, size, min_time,
+                                         repeat)
+                times.append(seconds)
+                results.append({
+                    "backend": backend.name,
+                    "operation": operation.name,
+                    "size": size,
+                    "ops_per_sec": 1 / seconds,
+                    "peak_bytes": measure_peak_memory(backend, operation,
+                                                      size),
+                })
+            if len(op_sizes) > 1:
+                scaling.append({
+                    "backend": backend.name,
+                    "operation": operation.name,
+                    "exponent": scaling_exponent(op_sizes, times),
+                })
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "results": results,
+        "scaling": scaling,
+    }
+
+
+def compare(report: Dict, baseline: Dict, tolerance: float) -> List[Dict]:
+    """Finds results that got slower than the baseline by more than `tolerance`.
+
+    Results without a matching backend, operation and size in the baseline are ignored.
+
+    Args:
+        report (Dict): A report returned by `run_benchmarks`.
+        baseline (Dict): A previously stored report.
+        tolerance (float): The allowed slowdown, e.g. 0.2 for 20%.
+
+    Returns:
+        List[Dict]: The regressed results, with their baseline ops/sec and relative change.
+    """
+    baseline_results = {(r["backend"], r["operation"], r["size"]): r
+                        for r in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        key = (result["backend"], result["operation"], result["size"])
+        if key not in baseline_results:
+            continue
+        expected = baseline_results[key]["ops_per_sec"]
+        change = result["ops_per_sec"] / expected - 1
+        if change < -tolerance:
+            regressions.append({
+                **result, "baseline_ops_per_sec": expected,
+                "change": change
+            })
+    return regressions
@@ -0,0 +1,78 @@
+"""Compares the peak memory of streaming a file into a list against reading it first.
+
+Writes a temporary newline-delimited file, then loads it with `streaming.load_lines`
+and by reading every line into a Python list before building the list from it. Reports
+the time taken, the size of the final list and the peak memory allocated while loading.
+
+Usage:
+    python -m py_polymorphic_list.bench.streaming [--lines N]
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+from ..streaming import dump_lines, load_lines
+from .backends import BACKENDS
+
+
+def _read_then_build(path: str) -> Any:
+    """Loads a file by reading all of its lines into a Python list first."""
+    with open(path) as f:
+        lines = f.read().splitlines()
+    return BACKENDS["polymorphic"].build(lines)
+
+
+def _stream(path: str) -> Any:
+    """Loads a file with streaming.load_lines."""
+    with open(path) as f:
+        return load_lines(f)
+
+
+def measure(load: Callable[[str], Any], path: str) -> Tuple[float, int, int]:
+    """Loads a file while tracing memory allocations.
+
+    Args:
+        load (Callable[[str], Any]): Loads the file at the given path into a list.
+        path (str): The path of the file.
+
+    Returns:
+        Tuple[float, int, int]: The seconds taken, the bytes held by the final list, and the
+        peak bytes allocated while loading.
+    """
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        lst = load(path)
+        elapsed = time.perf_counter() - start
+        final, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del lst
+    return elapsed, final, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=200_000)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    try:
+        with os.fdopen(fd, "w") as f:
+            dump_lines(range(args.lines), f, lambda i: f'{{"id": {i}}}')
+        print(f"{'loader':<18} {'seconds':>8} {'final bytes':>14} "
+              f"{'peak bytes':>14} {'peak/final':>10}")
+        for name, load in (("read then build", _read_then_build),
+                           ("load_lines", _stream)):
+            elapsed, final, peak = measure(load, path)
+            print(f"{name:<18} {elapsed:>8.3f} {final:>14,} {peak:>14,} "
+                  f"{peak / final:>10.2f}")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
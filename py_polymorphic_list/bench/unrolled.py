@@ -0,0 +1,112 @@
+"""Compares the memory and scan throughput of UnrolledList against NonEmptyList.
+
+Reports the memory allocated per element by each list, and the elements scanned per
+second by `index_of`, `count_occurrences` and a full traversal of each list.
+
+Usage:
+    python -m py_polymorphic_list.bench.unrolled [--size N] [--block-size N]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from ..unrolled_list import DEFAULT_BLOCK_SIZE, UnrolledList
+from .backends import BACKENDS
+from .runner import RECURSION_HEADROOM
+
+
+def _walk_nodes(lst) -> None:
+    """Visits every element of a NonEmptyList chain."""
+    while lst.length:
+        lst.data
+        lst = lst.next
+
+
+def _walk_unrolled(lst) -> None:
+    """Visits every element of an UnrolledList."""
+    for _ in lst:
+        pass
+
+
+def bytes_per_element(build: Callable[[List], Any], size: int) -> float:
+    """Measures the memory a list allocates per element, excluding the elements themselves.
+
+    Args:
+        build (Callable[[List], Any]): Builds the list from a list of elements.
+        size (int): The number of elements.
+
+    Returns:
+        float: The number of bytes allocated per element.
+    """
+    elements = list(range(size))
+    tracemalloc.start()
+    try:
+        lst = build(elements)
+        allocated = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del lst
+    return allocated / size
+
+
+def elements_per_sec(scan: Callable[[], Any], size: int,
+                     min_time: float) -> float:
+    """Measures how many elements per second a full scan of a list covers.
+
+    Args:
+        scan (Callable[[], Any]): Scans every element of the list once.
+        size (int): The number of elements in the list.
+        min_time (float): The minimum number of seconds to scan for.
+
+    Returns:
+        float: The number of elements scanned per second.
+    """
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        scan()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls * size / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000,
+                        help="number of elements for the memory comparison")
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    args = parser.parse_args()
+
+    builders: Dict[str, Callable[[List], Any]] = {
+        "NonEmptyList": BACKENDS["polymorphic"].build,
+        "UnrolledList": lambda e: UnrolledList(e, args.block_size),
+    }
+    print(f"Memory for {args.size:,} elements")
+    for name, build in builders.items():
+        print(f"  {name:<14} {bytes_per_element(build, args.size):>8.1f} "
+              f"bytes/element")
+
+    # NonEmptyList searches recurse once per element
+    scan_size = min(args.size, sys.getrecursionlimit() - RECURSION_HEADROOM)
+    last = scan_size - 1
+    print(f"\nScan throughput for {scan_size:,} elements (elements/sec)")
+    print(f"  {'':<14} {'index_of':>14} {'count':>14} {'traverse':>14}")
+    for name, build in builders.items():
+        lst = build(list(range(scan_size)))
+        walk = _walk_unrolled if isinstance(lst, UnrolledList) else _walk_nodes
+        rates = [
+            elements_per_sec(scan, scan_size, args.min_time) for scan in (
+                lambda: lst.index_of(last),
+                lambda: lst.count_occurrences(last),
+                lambda: walk(lst),
+            )
+        ]
+        print(f"  {name:<14} " + " ".join(f"{r:>14,.0f}" for r in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""Opt-in instrumentation of the PolymorphicList methods.
+
+While enabled, the public methods of PolymorphicList and all of its subclasses are
+wrapped to record, per class and method, the number of calls, the number of nodes visited, the
+exceptions raised and the wall time. Disabling restores the original methods, so the
+instrumentation costs nothing while it is disabled.
+
+Example:
+    with instrument() as stats:
+        lst = lst.insert(5, 0)
+    print(stats.to_prometheus())
+
+The counters are not thread-safe; instrument one thread at a time.
+"""
+import functools
+import sys
+import time
+from contextlib import contextmanager
+from typing import (Callable, Dict, FrozenSet, Iterator, List, Optional,
+                    Tuple)
+# Local imports
+from .polymorphic_list import EmptyList, NonEmptyList, PolymorphicList
+
+# The methods that are instrumented on every class that defines them.
+METHODS: Tuple[str, ...] = (
+    "__str__", "__eq__", "__contains__", "__copy__", "__add__", "size",
+    "append", "prepend", "insert", "remove_head", "remove_tail",
+    "remove_element", "remove_nth_occurrence", "remove_all_occurrences",
+    "remove_index", "get", "get_tail", "get_nth_occurrence", "index_of",
+    "count_occurrences", "get_many", "index_of_many", "contains_many",
+    "reverse", "rotate", "split_at", "take", "drop"
+)
+
+# The methods that walk the list in a loop instead of recursing once per node. Only
+# their calls are seen, so they don't record nodes_visited.
+ITERATIVE_METHODS: FrozenSet[str] = frozenset(
+    ("get_many", "index_of_many", "contains_many", "reverse", "rotate",
+     "split_at", "take", "drop"))
+
+
+class MethodStats:
+    """The counters recorded for a single method.
+
+    Attributes:
+        calls (int): Calls made from outside the list, i.e. not by another list method.
+        nodes_visited (Optional[int]): Invocations of the method on any node, including
+            recursive ones and the ones on the EmptyList at the end of the list. Only
+            recursive invocations are seen, so this is None for the ITERATIVE_METHODS and
+            for list classes that don't recurse, such as UnrolledList.
+        exceptions (int): Exceptions raised by the method, including ones the list
+            catches itself (e.g. the ListIsEmptyError behind `remove_tail`).
+        errors (int): Exceptions that propagated out of a call to the caller.
+        total_time (float): Seconds spent in calls, excluding time while nested in
+            another instrumented call.
+    """
+    __slots__ = ("calls", "nodes_visited", "exceptions", "errors",
+                 "total_time")
+
+    def __init__(self, count_nodes: bool = True):
+        """Initializes every counter to 0.
+
+        Args:
+            count_nodes (bool): Whether nodes_visited is recorded, or left as None.
+        """
+        self.nodes_visited: Optional[int] = 0 if count_nodes else None
+        self.reset()
+
+    def reset(self) -> None:
+        """Sets every counter back to 0."""
+        self.calls: int = 0
+        if self.nodes_visited is not None:
+            self.nodes_visited = 0
+        self.exceptions: int = 0
+        self.errors: int = 0
+        self.total_time: float = 0.0
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """Creates a dict of the counters.
+
+        Returns:
+            Dict[str, Optional[float]]: The counters by name.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Stats:
+    """The counters recorded for every instrumented method.
+
+    The counters are keyed by the name of the class of the list the method is called on
+    and the method name, e.g. `stats["NonEmptyList", "get"]`.
+    """
+    def __init__(self):
+        """Initializes the state of the Stats with no recorded methods."""
+        self.methods: Dict[Tuple[str, str], MethodStats] = {}
+        # Number of instrumented calls on the stack
+        self._depth: int = 0
+        # The exception last counted, so it is counted once while it propagates
+        self._last_exception: Optional[BaseException] = None
+
+    def __getitem__(self, method: Tuple[str, str]) -> MethodStats:
+        """Gets the counters for a method, creating them if needed.
+
+        Args:
+            method (Tuple[str, str]): The name of the class and the name of the method.
+
+        Returns:
+            MethodStats: The counters for the method.
+        """
+        try:
+            return self.methods[method]
+        except KeyError:
+            stats = self.methods[method] = MethodStats(_counts_nodes(*method))
+            return stats
+
+    def reset(self) -> None:
+        """Sets every recorded counter back to 0, without dropping the methods."""
+        for stats in self.methods.values():
+            stats.reset()
+
+    def as_dict(self) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+        """Creates a JSON serializable dict of the counters of every method.
+
+        Returns:
+            Dict[str, Dict[str, Dict[str, Optional[float]]]]: The counters by class name,
+                method name and counter name.
+        """
+        result: Dict[str, Dict[str, Dict[str, Optional[float]]]] = {}
+        for (cls, method), stats in sorted(self.methods.items()):
+            result.setdefault(cls, {})[method] = stats.as_dict()
+        return result
+
+    def to_prometheus(self, prefix: str = "polymorphic_list") -> str:
+        """Creates the counters in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): The prefix for every metric name.
+
+        Returns:
+            str: One counter per metric, class and method, e.g.
+                `polymorphic_list_calls_total{class="NonEmptyList",method="get"} 3`.
+                Counters that are not recorded for a method are left out.
+        """
+        lines: List[str] = []
+        for counter in MethodStats.__slots__:
+            name = (f"{prefix}_{counter}_seconds_total"
+                    if counter == "total_time" else
+                    f"{prefix}_{counter}_total")
+            lines.append(f"# TYPE {name} counter")
+            for (cls, method), stats in sorted(self.methods.items()):
+                value = getattr(stats, counter)
+                if value is not None:
+                    lines.append(f'{name}{{class="{cls}",method="{method}"}} '
+                                 f'{value}')
+        return "\n".join(lines) + "\n"
+
+
+# The currently recording Stats, and the methods replaced while it records.
+_active: Optional[Stats] = None
+_originals: Dict[Tuple[type, str], Callable] = {}
+
+
+def _classes() -> List[type]:
+    """Finds PolymorphicList and all of its subclasses."""
+    classes = [PolymorphicList]
+    for cls in classes:
+        classes.extend(cls.__subclasses__())
+    return classes
+
+
+def _counts_nodes(cls: str, name: str) -> bool:
+    """Checks whether a method visits the nodes of a list by recursing into each one.
+
+    Args:
+        cls (str): The name of the class of the list the method is called on.
+        name (str): The name of the method.
+
+    Returns:
+        bool: True if every invocation of the method is on a single node.
+    """
+    node_classes = {
+        c.__name__
+        for c in _classes() if issubclass(c, (NonEmptyList, EmptyList))
+    }
+    return cls in node_classes and name not in ITERATIVE_METHODS
+
+
+def _wrap(stats: Stats, name: str, func: Callable) -> Callable:
+    """Wraps a method so that every invocation is recorded in stats.
+
+    Args:
+        stats (Stats): Where to record the invocations.
+        name (str): The name of the method.
+        func (Callable): The method to wrap.
+
+    Returns:
+        Callable: The instrumented method.
+    """
+    timer = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # Recorded under the class of the list, since inherited methods are shared
+        method = stats[type(args[0]).__name__, name]
+        if method.nodes_visited is not None:
+            method.nodes_visited += 1
+        top_level = stats._depth == 0
+        if top_level:
+            method.calls += 1
+            # Every instrumented call adds a wrapper frame on top of the method's own
+            # frame, so a recursive method needs up to twice as many frames.
+            recursion_limit = sys.getrecursionlimit()
+            sys.setrecursionlimit(2 * recursion_limit)
+            start = timer()
+        stats._depth += 1
+        try:
+            return func(*args, **kwargs)
+        except BaseException as e:
+            if e is not stats._last_exception:
+                stats._last_exception = e
+                method.exceptions += 1
+            if top_level:
+                method.errors += 1
+            raise
+        finally:
+            stats._depth -= 1
+            if top_level:
+                method.total_time += timer() - start
+                stats._last_exception = None
+                sys.setrecursionlimit(recursion_limit)
+
+    return wrapper
+
+
+def enable(stats: Optional[Stats] = None) -> Stats:
+    """Starts recording PolymorphicList method calls.
+
+    Args:
+        stats (Optional[Stats]): Where to record the calls; defaults to a new Stats.
+
+    Raises:
+        RuntimeError: raised if instrumentation is already enabled
+
+    Returns:
+        Stats: The Stats the calls are recorded in.
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError("Instrumentation is already enabled")
+    stats = stats if stats is not None else Stats()
+    for cls in _classes():
+        for name in METHODS:
+            if name in cls.__dict__:
+                func = cls.__dict__[name]
+                _originals[(cls, name)] = func
+                setattr(cls, name, _wrap(stats, name, func))
+    _active = stats
+    return stats
+
+
+def disable() -> None:
+    """Stops recording and restores the original PolymorphicList methods."""
+    global _active
+    for (cls, name), func in _originals.items():
+        setattr(cls, name, func)
+    _originals.clear()
+    _active = None
+
+
+def get_stats() -> Optional[Stats]:
+    """Gets the Stats calls are currently recorded in.
+
+    Returns:
+        Optional[Stats]: The recording Stats, or None if instrumentation is disabled.
+    """
+    return _active
+
+
+@contextmanager
+def instrument(stats: Optional[Stats] = None) -> Iterator[Stats]:
+    """Records PolymorphicList method calls for the duration of a with block.
+
+    Args:
+        stats (Optional[Stats]): Where to record the calls; defaults to a new Stats.
+
+    Yields:
+        Stats: The Stats the calls are recorded in.
+    """
+    stats = enable(stats)
+    try:
+        yield stats
+    finally:
+        disable()
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import sys
+from collections import deque
+# Local imports
+from .exceptions import ListIsEmptyError
+from .polymorphic_list import EmptyList, NonEmptyList
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Deque, Dict, Optional, Tuple
+
+# `sys.getrefcount` is CPython specific. Without it there is no way to tell
+# whether a detached node is still referenced elsewhere, so nothing is reused.
+_getrefcount = getattr(sys, "getrefcount", None)
+
+
+def _refs_held_by_acquire() -> int:
+    """Counts the references on an otherwise unreferenced node while `acquire` inspects it.
+
+    The node is popped from a deque into a local variable, exactly like in
+    `NodePool.acquire`, so the count matches whatever this interpreter adds for the
+    local variable and the argument passed to `sys.getrefcount`.
+
+    Returns:
+        int: The reference count of a node that only the pool references.
+    """
+    nodes = deque([NonEmptyList(None, EmptyList())])
+    node = nodes.popleft()
+    return _getrefcount(node)
+
+
+# Calibrated once at import, since the count differs between CPython versions.
+_POOL_ONLY_REFS = _refs_held_by_acquire() if _getrefcount is not None else 0
+
+# The currently installed pool.
+_installed: Optional[NodePool] = None
+
+
+class NodePool:
+    """A bounded free-list that recycles detached NonEmptyList nodes.
+
+    While a pool is installed, nodes detached by `remove_head`, `remove_tail` and the
+    other removal methods are handed to the pool, and `append`, `prepend` and
+    `insert` reuse them instead of allocating new NonEmptyList objects.
+
+    A released node is left untouched, since the caller may still hold it (e.g. a node
+    returned by `get`). It is only reused once the pool holds the sole reference to it;
+    nodes that are still referenced elsewhere are dropped from the pool instead.
+
+    Until it is reused, a pooled node keeps its `data` and the rest of the list it was
+    detached from alive, so the pool can retain up to `max_size` elements plus whatever
+    their `next` chains reference. Call `shrink` or `clear` to drop them early.
+
+    Pooling replaces the allocating and removing methods of NonEmptyList and EmptyList
+    with pooled variants while the pool is installed, so lists pay nothing for it
+    otherwise.
+
+    Args:
+        max_size (int): The maximum number of nodes kept in the pool.
+    """
+    def __init__(self, max_size: int = 1024):
+        """Initializes the state of the NodePool.
+
+        Args:
+            max_size (int): The maximum number of nodes kept in the pool.
+
+        Raises:
+            ValueError: raised if max_size is negative
+        """
+        if max_size < 0:
+            raise ValueError("`max_size` must be non-negative")
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self.rejected: int = 0
+        self._nodes: Deque[object] = deque()
+
+    def __len__(self) -> int:
+        """Finds the number of nodes currently held by the pool.
+
+        Returns:
+            int: The number of pooled nodes.
+        """
+        return len(self._nodes)
+
+    def __enter__(self) -> 'NodePool':
+        """Installs the pool for the duration of a with block.
+
+        Returns:
+            NodePool: The installed pool.
+        """
+        self.install()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Uninstalls the pool and drops every pooled node."""
+        self.uninstall()
+        self.clear()
+
+    def install(self) -> None:
+        """Makes this pool the process-wide pool used by every PolymorphicList.
+
+        Raises:
+            RuntimeError: raised if another pool is installed, or if the list methods were
+                replaced by someone else (e.g. instrumentation enabled before the pool)
+        """
+        global _installed
+        if _installed is self:
+            return
+        if _installed is not None:
+            raise RuntimeError("Another NodePool is already installed")
+        for (cls, name), original in _UNPOOLED_METHODS.items():
+            if cls.__dict__[name] is not original:
+                raise RuntimeError(
+                    f"{cls.__name__}.{name} is already replaced; "
+                    "install the pool before instrumenting the lists")
+        for (cls, name), pooled in _POOLED_METHODS.items():
+            setattr(cls, name, pooled)
+        _installed = self
+
+    def uninstall(self) -> None:
+        """Stops using this pool if it is the installed process-wide pool.
+
+        Raises:
+            RuntimeError: raised if the pooled list methods were replaced by someone else
+                (e.g. instrumentation that is still enabled)
+        """
+        global _installed
+        if _installed is not self:
+            return
+        for (cls, name), pooled in _POOLED_METHODS.items():
+            if cls.__dict__[name] is not pooled:
+                raise RuntimeError(
+                    f"{cls.__name__}.{name} is replaced; "
+                    "disable the instrumentation before uninstalling the pool")
+        for (cls, name), original in _UNPOOLED_METHODS.items():
+            setattr(cls, name, original)
+        _installed = None
+
+    def release(self, node: object) -> None:
+        """Hands a detached node to the pool, if there is room for it.
+
+        Args:
+            node (NonEmptyList): The node that was unlinked from its list.
+        """
+        if len(self._nodes) < self.max_size and _getrefcount is not None:
+            self._nodes.append(node)
+
+    def acquire(self, data, next) -> Optional[object]:
+        """Reinitializes a pooled node with the given data and next reference.
+
+        Args:
+            data ([type]): The data to store in the node
+            next (PolymorphicList): Reference to the next node
+
+        Returns:
+            Optional[NonEmptyList]: A recycled node, or None if no node is free to reuse.
+        """
+        nodes = self._nodes
+        while nodes:
+            # Oldest first, so a node released earlier drops its `next` reference
+            # to a node released after it before that node is inspected.
+            node = nodes.popleft()
+            if _getrefcount(node) > _POOL_ONLY_REFS:
+                # Still referenced outside of the pool, so it can't be reused.
+                self.rejected += 1
+                continue
+            node.__init__(data, next)
+            self.hits += 1
+            return node
+        self.misses += 1
+        return None
+
+    def shrink(self, size: int = 0) -> None:
+        """Drops pooled nodes until at most `size` remain.
+
+        Args:
+            size (int): The number of nodes to keep.
+        """
+        nodes = self._nodes
+        while len(nodes) > max(size, 0):
+            nodes.pop()
+
+    def clear(self) -> None:
+        """Drops every pooled node."""
+        self._nodes.clear()
+
+
+def _new_node(data, next) -> NonEmptyList:
+    """Creates a node, reusing one from the installed pool if there is a free one."""
+    node = _installed.acquire(data, next)
+    return node if node is not None else NonEmptyList(data, next)
+
+
+# Pooled variants of the NonEmptyList and EmptyList methods that create or detach
+# nodes. They mirror the originals in polymorphic_list.py exactly, except that nodes
+# come from and go back to the installed pool.
+
+
+def _prepend(self, element):
+    return _new_node(element, self)
+
+
+def _insert(self, element, index):
+    if index > self.size() or index < 0:
+        raise IndexError("Index out of range")
+    elif index == 0:
+        # Insert at head
+        return _new_node(element, self)
+    elif index == 1:
+        # Insert at some other index
+        self.next = _new_node(element, self.next)
+        self.length += 1
+    else:
+        # Tell the next node to handle the insert
+        self.next.insert(element, index - 1)
+        self.length += 1
+    return self
+
+
+def _remove_head(self):
+    _installed.release(self)
+    return self.next
+
+
+def _remove_tail(self):
+    try:
+        self.next = self.next.remove_tail()
+        self.length -= 1
+        return self
+    except ListIsEmptyError:
+        # This is the last node, so hand back the EmptyList it points to
+        _installed.release(self)
+        return self.next
+
+
+def _remove_element(self, element):
+    if self.data == element:
+        _installed.release(self)
+        return self.next
+    else:
+        self.next = self.next.remove_element(element)
+        self.length -= 1
+        return self
+
+
+def _remove_nth_occurrence(self, element, n):
+    if self.data == element:
+        if n == 1:
+            _installed.release(self)
+            return self.next
+        else:
+            self.next = self.next.remove_nth_occurrence(element, n - 1)
+    else:
+        self.next = self.next.remove_nth_occurrence(element, n)
+
+    self.length -= 1
+    return self
+
+
+def _remove_all_occurrences(self, element):
+    if (self.data == element):
+        _installed.release(self)
+        return self.next.remove_all_occurrences(element)
+    else:
+        self.next = self.next.remove_all_occurrences(element)
+        self.length = self.next.length + 1
+        return self
+
+
+def _remove_index(self, index):
+    if index == 0:
+        _installed.release(self)
+        return self.next
+    else:
+        self.next = self.next.remove_index(index - 1)
+        self.length -= 1
+        return self
+
+
+def _empty_append(self, element):
+    return _new_node(element, self)
+
+
+def _empty_prepend(self, element):
+    return _new_node(element, self)
+
+
+_POOLED_METHODS: Dict[Tuple[type, str], Callable] = {
+    (NonEmptyList, "prepend"): _prepend,
+    (NonEmptyList, "insert"): _insert,
+    (NonEmptyList, "remove_head"): _remove_head,
+    (NonEmptyList, "remove_tail"): _remove_tail,
+    (NonEmptyList, "remove_element"): _remove_element,
+    (NonEmptyList, "remove_nth_occurrence"): _remove_nth_occurrence,
+    (NonEmptyList, "remove_all_occurrences"): _remove_all_occurrences,
+    (NonEmptyList, "remove_index"): _remove_index,
+    (EmptyList, "append"): _empty_append,
+    (EmptyList, "prepend"): _empty_prepend,
+}
+_UNPOOLED_METHODS: Dict[Tuple[type, str], Callable] = {
+    key: key[0].__dict__[key[1]] for key in _POOLED_METHODS
+}
+for (cls, name), pooled in _POOLED_METHODS.items():
+    # Keep the documentation of the replaced methods, e.g. for help()
+    pooled.__doc__ = _UNPOOLED_METHODS[(cls, name)].__doc__
@@ -1,9 +1,32 @@
-from copy import copy
-from typing import Generic, TypeVar, Union
+from __future__ import annotations
 # Local imports
 from .exceptions import ListIsEmptyError
 
-T = TypeVar("T")
+# `typing` is only imported by type checkers, since importing it at runtime is most
+# of the import time of this package. Annotations are not evaluated at runtime.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import (Dict, Generic, Iterable, List, Optional, Tuple, TypeVar,
+                        Union)
+
+    T = TypeVar("T")
+else:
+
+    class Generic:
+        """Runtime stand-in for typing.Generic, so that classes can still be subscripted.
+
+        `NonEmptyList[int]` returns NonEmptyList itself, so constructing nodes has no
+        generic alias overhead.
+        """
+        __slots__ = ()
+
+        def __class_getitem__(cls, item):
+            return cls
+
+    # A string, so that typing.get_type_hints resolves `T` to a forward reference
+    # instead of NoneType. Names such as `Union` are not defined at runtime either, so
+    # get_type_hints raises NameError for most methods.
+    T = "T"
 
 
 class PolymorphicList(Generic[T]):
@@ -78,7 +101,7 @@ class PolymorphicList(Generic[T]):
             Union[NonEmptyList[T], EmptyList[T]]: returns either an EmptyList[T] or a NonEmptyList[T] with elements of the two lists together
         """
         if (isinstance(other, NonEmptyList) or isinstance(other, EmptyList)):
-            return copy(self)._add(copy(other))
+            return self.__copy__()._add(other.__copy__())
         else:
             raise TypeError(
                 "`other` must be an object with super type PolymorphicList")
@@ -277,6 +300,165 @@ class PolymorphicList(Generic[T]):
         """
         raise NotImplementedError()
 
+    def get_many(self, indices: Iterable[int]) -> List['NonEmptyList[T]']:
+        """Gets the NonEmptyList nodes at many indices in a single pass over the list.
+
+        The indices are sorted and answered in one sweep, so this takes O(n + k log k)
+        for k indices instead of the O(n * k) of calling `get` for each one.
+
+        Args:
+            indices (Iterable[int]): Indices in the list, in any order.
+
+        Raises:
+            IndexError: raised if any index is invalid
+
+        Returns:
+            List[NonEmptyList[T]]: The node at each index, in the order of the input indices.
+        """
+        indices = list(indices)
+        for index in indices:
+            if index > self.length - 1 or index < 0:
+                raise IndexError("Index out of range")
+        nodes: Dict[int, NonEmptyList[T]] = {}
+        node = self
+        position = 0
+        for index in sorted(set(indices)):
+            while position < index:
+                node = node.next
+                position += 1
+            nodes[index] = node
+        return [nodes[index] for index in indices]
+
+    def index_of_many(self, elements: Iterable[T]) -> List[int]:
+        """Finds the index of the first occurrence of many elements in a single pass over the list.
+
+        The elements are looked up in a temporary hash table while traversing the list, so
+        this takes O(n + k) for k elements instead of the O(n * k) of calling `index_of`
+        for each one. The elements must be hashable, the data in the list need not be.
+
+        Args:
+            elements (Iterable[T]): The elements to look for.
+
+        Raises:
+            ValueError: raised if any element is not in the list
+
+        Returns:
+            List[int]: The index of each element, in the order of the input elements.
+        """
+        elements = list(elements)
+        found = self._find_first_indices(elements)
+        if len(found) < len(set(elements)):
+            raise ValueError("`element` does not exist in the list")
+        return [found[element] for element in elements]
+
+    def contains_many(self, elements: Iterable[T]) -> List[bool]:
+        """Checks whether many elements exist in the list in a single pass over the list.
+
+        The elements must be hashable, the data in the list need not be.
+
+        Args:
+            elements (Iterable[T]): The elements to look for.
+
+        Returns:
+            List[bool]: Whether each element was found, in the order of the input elements.
+        """
+        elements = list(elements)
+        found = self._find_first_indices(elements)
+        return [element in found for element in elements]
+
+    def _find_first_indices(self, elements: List[T]) -> Dict[T, int]:
+        """Helper method for index_of_many and contains_many. Finds the first index of each element.
+
+        The traversal stops as soon as every element has been found.
+
+        Args:
+            elements (List[T]): The hashable elements to look for.
+
+        Returns:
+            Dict[T, int]: The index of the first occurrence of each element found in the list.
+        """
+        remaining = set(elements)
+        found: Dict[T, int] = {}
+        node = self
+        index = 0
+        while remaining and isinstance(node, NonEmptyList):
+            try:
+                if node.data in remaining:
+                    found[node.data] = index
+                    remaining.discard(node.data)
+            except TypeError:
+                # Unhashable data can't be looked up, so compare it with each element
+                for element in [e for e in remaining if e == node.data]:
+                    found[element] = index
+                    remaining.discard(element)
+            node = node.next
+            index += 1
+        return found
+
+    def reverse(self) -> Union['NonEmptyList[T]', 'EmptyList[T]']:
+        """Reverses the list in place by relinking its nodes.
+
+        Returns:
+            Union[NonEmptyList[T], EmptyList[T]]: The new head of the reversed list.
+        """
+        raise NotImplementedError()
+
+    def rotate(self, k: int) -> Union['NonEmptyList[T]', 'EmptyList[T]']:
+        """Rotates the list k steps to the right in place, like collections.deque.rotate.
+
+        Args:
+            k (int): The number of steps; negative values rotate to the left.
+
+        Returns:
+            Union[NonEmptyList[T], EmptyList[T]]: The new head of the rotated list.
+        """
+        raise NotImplementedError()
+
+    def split_at(
+        self, index: int
+    ) -> Tuple[Union['NonEmptyList[T]', 'EmptyList[T]'], Union[
+            'NonEmptyList[T]', 'EmptyList[T]']]:
+        """Splits the list in place into the elements before index and the rest.
+
+        Args:
+            index (int): The index of the first element of the second list.
+
+        Raises:
+            IndexError: raised if index is not between 0 and the size of the list
+
+        Returns:
+            Tuple[Union[NonEmptyList[T], EmptyList[T]], Union[NonEmptyList[T], EmptyList[T]]]: The heads of the two lists.
+        """
+        raise NotImplementedError()
+
+    def take(self, n: int) -> Union['NonEmptyList[T]', 'EmptyList[T]']:
+        """Keeps the first n elements of the list, unlinking the rest.
+
+        Args:
+            n (int): The number of elements to keep.
+
+        Raises:
+            IndexError: raised if n is not between 0 and the size of the list
+
+        Returns:
+            Union[NonEmptyList[T], EmptyList[T]]: The head of the list of the first n elements.
+        """
+        return self.split_at(n)[0]
+
+    def drop(self, n: int) -> Union['NonEmptyList[T]', 'EmptyList[T]']:
+        """Drops the first n elements of the list.
+
+        Args:
+            n (int): The number of elements to drop.
+
+        Raises:
+            IndexError: raised if n is not between 0 and the size of the list
+
+        Returns:
+            Union[NonEmptyList[T], EmptyList[T]]: The head of the list after the first n elements.
+        """
+        raise NotImplementedError()
+
 
 class NonEmptyList(PolymorphicList[T]):
     """Represents a NonEmptyList with a T type data, and a reference to the next node in the abstraction
@@ -343,7 +525,7 @@ class NonEmptyList(PolymorphicList[T]):
         Returns:
             NonEmptyList: A copy of the NonEmptyList and its next references.
         """
-        return NonEmptyList(self.data, copy(self.next))
+        return NonEmptyList(self.data, self.next.__copy__())
 
     def _add(
         self, other: Union['NonEmptyList[T]', 'EmptyList[T]']
@@ -433,7 +615,8 @@ class NonEmptyList(PolymorphicList[T]):
             self.length -= 1
             return self
         except ListIsEmptyError:
-            return EmptyList()
+            # This is the last node, so hand back the EmptyList it points to
+            return self.next
 
     def remove_element(self,
                        element: T) -> Union['NonEmptyList[T]', 'EmptyList[T]']:
@@ -492,6 +675,7 @@ class NonEmptyList(PolymorphicList[T]):
             return self.next.remove_all_occurrences(element)
         else:
             self.next = self.next.remove_all_occurrences(element)
+            self.length = self.next.length + 1
             return self
 
     def remove_index(self,
@@ -589,6 +773,108 @@ class NonEmptyList(PolymorphicList[T]):
         """
         return (self.data == element) + self.next.count_occurrences(element)
 
+    def reverse(self) -> 'NonEmptyList[T]':
+        """Reverses the list in place by relinking its nodes in a single pass.
+
+        Returns:
+            NonEmptyList[T]: The new head of the reversed list, i.e. the former last node.
+        """
+        prev = None
+        node = self
+        length = 0
+        while isinstance(node, NonEmptyList):
+            length += 1
+            node.next, node.length, prev, node = prev, length, node, node.next
+        # `node` is the EmptyList that ended the list, which now follows the old head
+        self.next = node
+        return prev
+
+    def rotate(self, k: int) -> 'NonEmptyList[T]':
+        """Rotates the list k steps to the right in place, like collections.deque.rotate.
+
+        Args:
+            k (int): The number of steps; negative values rotate to the left.
+
+        Returns:
+            NonEmptyList[T]: The new head of the rotated list.
+        """
+        size = self.length
+        # Number of nodes that move from the front to the back of the list
+        front = -k % size
+        if front == 0:
+            return self
+        back = size - front
+        node = self
+        for _ in range(front - 1):
+            node.length -= back
+            node = node.next
+        node.length -= back
+        new_tail = node
+        new_head = node.next
+        node = new_head
+        while isinstance(node.next, NonEmptyList):
+            node.length += front
+            node = node.next
+        node.length += front
+        # Link the old tail to the old head, and end the list after the moved nodes
+        new_tail.next = node.next
+        node.next = self
+        return new_head
+
+    def split_at(
+        self, index: int
+    ) -> Tuple[Union['NonEmptyList[T]', 'EmptyList[T]'], Union[
+            'NonEmptyList[T]', 'EmptyList[T]']]:
+        """Splits the list in place into the elements before index and the rest.
+
+        Only the nodes before index are visited, and each one has its size fixed once.
+
+        Args:
+            index (int): The index of the first element of the second list.
+
+        Raises:
+            IndexError: raised if index is not between 0 and the size of the list
+
+        Returns:
+            Tuple[Union[NonEmptyList[T], EmptyList[T]], Union[NonEmptyList[T], EmptyList[T]]]: The heads of the two lists.
+        """
+        if index > self.length or index < 0:
+            raise IndexError("Index out of range")
+        elif index == 0:
+            return EmptyList(), self
+        elif index == self.length:
+            return self, EmptyList()
+        rest = self.length - index
+        node = self
+        for _ in range(index - 1):
+            node.length -= rest
+            node = node.next
+        node.length -= rest
+        second = node.next
+        node.next = EmptyList()
+        return self, second
+
+    def drop(self, n: int) -> Union['NonEmptyList[T]', 'EmptyList[T]']:
+        """Drops the first n elements of the list.
+
+        The dropped nodes are left linked to the rest of the list, which is unchanged.
+
+        Args:
+            n (int): The number of elements to drop.
+
+        Raises:
+            IndexError: raised if n is not between 0 and the size of the list
+
+        Returns:
+            Union[NonEmptyList[T], EmptyList[T]]: The head of the list after the first n elements.
+        """
+        if n > self.length or n < 0:
+            raise IndexError("Index out of range")
+        node = self
+        for _ in range(n):
+            node = node.next
+        return node
+
 
 class EmptyList(PolymorphicList[T]):
     """Represents a EmptyList, the last node in the abstraction, which has no data or next pointer
@@ -824,4 +1110,56 @@ class EmptyList(PolymorphicList[T]):
         Returns:
             int: The num occurrences of element found
         """
-        return 0
\ No newline at end of file
+        return 0
+
+    def reverse(self) -> 'EmptyList[T]':
+        """Reverses the list, which for an EmptyList is a no-op.
+
+        Returns:
+            EmptyList[T]: This EmptyList.
+        """
+        return self
+
+    def rotate(self, k: int) -> 'EmptyList[T]':
+        """Rotates the list, which for an EmptyList is a no-op.
+
+        Args:
+            k (int): The number of steps; negative values rotate to the left.
+
+        Returns:
+            EmptyList[T]: This EmptyList.
+        """
+        return self
+
+    def split_at(self,
+                 index: int) -> Tuple['EmptyList[T]', 'EmptyList[T]']:
+        """Splits the list at index, which must be 0 for an EmptyList.
+
+        Args:
+            index (int): The index of the first element of the second list.
+
+        Raises:
+            IndexError: raised if index is not 0
+
+        Returns:
+            Tuple[EmptyList[T], EmptyList[T]]: This EmptyList, and a new EmptyList.
+        """
+        if index != 0:
+            raise IndexError("Index out of range")
+        return self, EmptyList()
+
+    def drop(self, n: int) -> 'EmptyList[T]':
+        """Drops the first n elements of the list, which must be 0 for an EmptyList.
+
+        Args:
+            n (int): The number of elements to drop.
+
+        Raises:
+            IndexError: raised if n is not 0
+
+        Returns:
+            EmptyList[T]: This EmptyList.
+        """
+        if n != 0:
+            raise IndexError("Index out of range")
+        return self
\ No newline at end of file
@@ -0,0 +1,265 @@
+"""Streaming loaders and writers between files and PolymorphicLists.
+
+The loaders build a NonEmptyList chain directly while reading, without an intermediate
+Python list, so peak memory stays close to the size of the final list. Every element is
+prepended and the chain is reversed once at the end, which keeps loading O(n).
+"""
+from __future__ import annotations
+# Local imports
+from .polymorphic_list import EmptyList, NonEmptyList, T
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import (IO, Any, AnyStr, Callable, Iterable, Iterator,
+                        Optional, Union)
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def load_lines(source: Union[IO[AnyStr], Iterable[AnyStr]],
+               parse: Optional[Callable[[AnyStr], T]] = None,
+               max_elements: Optional[int] = None,
+               chunk_size: int = DEFAULT_CHUNK_SIZE
+               ) -> Union[NonEmptyList[T], EmptyList[T]]:
+    """Builds a list from newline-delimited records, e.g. a text or NDJSON file.
+
+    Line terminators (`\\n` or `\\r\\n`) are stripped from every line.
+
+    Args:
+        source (Union[IO[AnyStr], Iterable[AnyStr]]): A text or binary file object, which is
+            read in chunks of chunk_size, or any iterable of lines.
+        parse (Optional[Callable[[AnyStr], T]]): Converts each line to an element; by default
+            the lines themselves are the elements.
+        max_elements (Optional[int]): Stops reading after this many elements.
+        chunk_size (int): The number of characters or bytes read from a file at a time.
+
+    Raises:
+        ValueError: raised if max_elements is negative
+
+    Returns:
+        Union[NonEmptyList[T], EmptyList[T]]: The head of the loaded list.
+    """
+    if hasattr(source, "read"):
+        lines = _read_lines(source, chunk_size)
+    else:
+        lines = map(_strip_newline, source)
+    return _build(lines, parse, max_elements)
+
+
+def load_records(source: IO[bytes],
+                 record_size: int,
+                 parse: Optional[Callable[[bytes], T]] = None,
+                 max_elements: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE
+                 ) -> Union[NonEmptyList[T], EmptyList[T]]:
+    """Builds a list from fixed-width binary records.
+
+    Args:
+        source (IO[bytes]): A binary file object.
+        record_size (int): The number of bytes per record.
+        parse (Optional[Callable[[bytes], T]]): Converts each record to an element, e.g. the
+            `unpack` method of a struct.Struct; by default the records are the elements.
+        max_elements (Optional[int]): Stops reading after this many elements.
+        chunk_size (int): The approximate number of bytes read at a time, rounded to a whole
+            number of records.
+
+    Raises:
+        ValueError: raised if record_size is not positive, max_elements is negative, or the
+            source ends in the middle of a record
+
+    Returns:
+        Union[NonEmptyList[T], EmptyList[T]]: The head of the loaded list.
+    """
+    if record_size <= 0:
+        raise ValueError("`record_size` must be positive")
+    return _build(_read_records(source, record_size, chunk_size), parse,
+                  max_elements)
+
+
+def dump_lines(lst: Union[NonEmptyList[T], EmptyList[T], Iterable[T]],
+               file: IO[str],
+               format: Callable[[T], str] = str,
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Writes every element of a list to a text file, one line per element.
+
+    Args:
+        lst (Union[NonEmptyList[T], EmptyList[T], Iterable[T]]): The list to write, or any
+            other iterable of elements.
+        file (IO[str]): A text file object.
+        format (Callable[[T], str]): Converts each element to a line, without the newline.
+        chunk_size (int): The approximate number of characters written at a time.
+
+    Returns:
+        int: The number of elements written.
+    """
+    return _write((format(element) + "\n" for element in _elements(lst)),
+                  file, "", chunk_size)
+
+
+def dump_records(lst: Union[NonEmptyList[T], EmptyList[T], Iterable[T]],
+                 file: IO[bytes],
+                 serialize: Callable[[T], bytes] = bytes,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Writes every element of a list to a binary file as a record.
+
+    Args:
+        lst (Union[NonEmptyList[T], EmptyList[T], Iterable[T]]): The list to write, or any
+            other iterable of elements.
+        file (IO[bytes]): A binary file object.
+        serialize (Callable[[T], bytes]): Converts each element to a record, e.g. the `pack`
+            method of a struct.Struct.
+        chunk_size (int): The approximate number of bytes written at a time.
+
+    Returns:
+        int: The number of elements written.
+    """
+    return _write(map(serialize, _elements(lst)), file, b"", chunk_size)
+
+
+def _build(items: Iterable[Any], parse: Optional[Callable[[Any], T]],
+           max_elements: Optional[int]) -> Union[NonEmptyList[T], EmptyList[T]]:
+    """Helper method for the loaders. Builds a list from items in a single pass.
+
+    Args:
+        items (Iterable[Any]): The raw records.
+        parse (Optional[Callable[[Any], T]]): Converts each record to an element.
+        max_elements (Optional[int]): Stops after this many elements.
+
+    Raises:
+        ValueError: raised if max_elements is negative
+
+    Returns:
+        Union[NonEmptyList[T], EmptyList[T]]: The head of the list.
+    """
+    if max_elements is not None:
+        if max_elements < 0:
+            raise ValueError("`max_elements` must be non-negative")
+        # Stop consuming the source as soon as the cap is reached
+        items = (item for _, item in zip(range(max_elements), items))
+    if parse is not None:
+        items = map(parse, items)
+    # Prepending is O(1), and reversing fixes every node's length once at the end
+    lst = EmptyList()
+    for item in items:
+        lst = NonEmptyList(item, lst)
+    return lst.reverse()
+
+
+def _read_lines(file: IO[AnyStr], chunk_size: int) -> Iterator[AnyStr]:
+    """Reads lines from a file object in chunks of chunk_size.
+
+    Args:
+        file (IO[AnyStr]): A text or binary file object.
+        chunk_size (int): The number of characters or bytes read at a time.
+
+    Yields:
+        AnyStr: Every line, without its line terminator.
+    """
+    rest = None
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        if rest:
+            chunk = rest + chunk
+        newline, cr = ("\n", "\r") if isinstance(chunk, str) else (b"\n", b"\r")
+        lines = chunk.split(newline)
+        # The last piece is an incomplete line, or empty if the chunk ended a line
+        rest = lines.pop()
+        if cr in chunk:
+            lines = [_strip_cr(line) for line in lines]
+        yield from lines
+    if rest:
+        yield _strip_cr(rest)
+
+
+def _read_records(file: IO[bytes], record_size: int,
+                  chunk_size: int) -> Iterator[bytes]:
+    """Reads fixed-width records from a binary file object in whole-record chunks.
+
+    Args:
+        file (IO[bytes]): A binary file object.
+        record_size (int): The number of bytes per record.
+        chunk_size (int): The approximate number of bytes read at a time.
+
+    Raises:
+        ValueError: raised if the file ends in the middle of a record
+
+    Yields:
+        bytes: Every record.
+    """
+    chunk_size = max(chunk_size // record_size, 1) * record_size
+    rest = b""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        if rest:
+            chunk = rest + chunk
+        end = len(chunk) - len(chunk) % record_size
+        for start in range(0, end, record_size):
+            yield chunk[start:start + record_size]
+        rest = chunk[end:]
+    if rest:
+        raise ValueError("The source ends in the middle of a record")
+
+
+def _write(pieces: Iterable[AnyStr], file: IO[AnyStr], empty: AnyStr,
+           chunk_size: int) -> int:
+    """Writes pieces to a file, joining them into chunks of about chunk_size.
+
+    Args:
+        pieces (Iterable[AnyStr]): The strings or bytes to write.
+        file (IO[AnyStr]): The file object to write to.
+        empty (AnyStr): An empty string or bytes, used to join the pieces.
+        chunk_size (int): The approximate number of characters or bytes written at a time.
+
+    Returns:
+        int: The number of pieces written.
+    """
+    count = 0
+    buffered = 0
+    buffer = []
+    for piece in pieces:
+        buffer.append(piece)
+        buffered += len(piece)
+        count += 1
+        if buffered >= chunk_size:
+            file.write(empty.join(buffer))
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        file.write(empty.join(buffer))
+    return count
+
+
+def _elements(
+        lst: Union[NonEmptyList[T], EmptyList[T], Iterable[T]]) -> Iterator[T]:
+    """Iterates over the elements of a NonEmptyList chain, or of any other iterable.
+
+    Args:
+        lst (Union[NonEmptyList[T], EmptyList[T], Iterable[T]]): The elements to iterate over.
+
+    Yields:
+        T: Every element, in order.
+    """
+    if isinstance(lst, (NonEmptyList, EmptyList)):
+        while isinstance(lst, NonEmptyList):
+            yield lst.data
+            lst = lst.next
+    else:
+        yield from lst
+
+
+def _strip_newline(line: AnyStr) -> AnyStr:
+    """Strips a trailing `\\n` or `\\r\\n` from a line."""
+    if line[-1:] in ("\n", b"\n"):
+        line = line[:-1]
+    return _strip_cr(line)
+
+
+def _strip_cr(line: AnyStr) -> AnyStr:
+    """Strips a trailing `\\r` left over from a `\\r\\n` line terminator."""
+    if line[-1:] in ("\r", b"\r"):
+        return line[:-1]
+    return line
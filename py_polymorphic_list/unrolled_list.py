@@ -0,0 +1,701 @@
+from __future__ import annotations
+
+from itertools import chain, islice
+# Local imports
+from .exceptions import ListIsEmptyError
+from .polymorphic_list import PolymorphicList, T
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_BLOCK_SIZE = 64
+
+
+class _Block:
+    """A node of an UnrolledList, holding up to `block_size` consecutive elements."""
+    __slots__ = ("elements", "prev", "next")
+
+    def __init__(self, elements: List[T]):
+        """Initializes an unlinked block.
+
+        Args:
+            elements (List[T]): The elements stored in this block
+        """
+        self.elements: List[T] = elements
+        self.prev: Optional[_Block] = None
+        self.next: Optional[_Block] = None
+
+
+class UnrolledList(PolymorphicList[T]):
+    """Represents an unrolled linked list, where each node holds a block of elements
+
+    Storing up to `block_size` elements in a Python list per node saves most of the
+    per-element object overhead of NonEmptyList, and lets searches scan each block
+    with C-level list operations. Blocks are split when they overflow, and merged with
+    or refilled from their successor when they drop below half full.
+
+    Unlike NonEmptyList, every method works iteratively and updates the list in place,
+    so methods that return the new list return the UnrolledList itself. Since there is
+    no node per element, `get`, `get_tail` and `get_nth_occurrence` return the element.
+
+    Args:
+        PolymorphicList ([type]): Extends the PolymorphicList class to have a generic type T.
+    """
+    def __init__(self,
+                 elements: Iterable[T] = (),
+                 block_size: int = DEFAULT_BLOCK_SIZE):
+        """Initializes the state of the UnrolledList.
+
+        Args:
+            elements (Iterable[T]): The initial elements of the list
+            block_size (int): The maximum number of elements per block
+
+        Raises:
+            ValueError: raised if block_size is less than 2
+        """
+        if block_size < 2:
+            raise ValueError("`block_size` must be at least 2")
+        self.block_size: int = block_size
+        self.head: Optional[_Block] = None
+        self.tail: Optional[_Block] = None
+        self.length: int = 0
+        self.extend(elements)
+
+    def __str__(self) -> str:
+        """Creates a string representation for the UnrolledList
+
+        Returns:
+            str: The string representation of each object in the list separated with arrows.
+        """
+        return " -> ".join(map(str, self))
+
+    def __eq__(self, other: object) -> bool:
+        """Checks if this UnrolledList holds the same elements as another input object.
+
+        Args:
+            other (object): The input object to compare to.
+
+        Returns:
+            bool: a bool indication whether the current object is equal to the given object
+        """
+        if not isinstance(other, UnrolledList) or self.length != other.length:
+            return False
+        return all(a == b for a, b in zip(self, other))
+
+    def __contains__(self, element: T) -> bool:
+        """Overrides membership op to check whether an element exists in the list.
+
+        Args:
+            element (T): The element to look for.
+
+        Returns:
+            bool: a boolean indication of whether the element was found.
+        """
+        block = self.head
+        while block is not None:
+            if element in block.elements:
+                return True
+            block = block.next
+        return False
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterates over the elements of the list in order.
+
+        Returns:
+            Iterator[T]: An iterator over the elements.
+        """
+        # Only the blocks are walked in Python; each block is iterated at C level
+        return chain.from_iterable(block.elements for block in self._blocks())
+
+    def __copy__(self) -> UnrolledList[T]:
+        """Returns a copy of the UnrolledList
+
+        Returns:
+            UnrolledList[T]: A copy of the list, with the same block size.
+        """
+        result: UnrolledList[T] = UnrolledList((), self.block_size)
+        block = self.head
+        while block is not None:
+            result._link_after(result.tail, _Block(block.elements[:]))
+            block = block.next
+        result.length = self.length
+        return result
+
+    def __add__(self, other: object) -> UnrolledList[T]:
+        """Adds two UnrolledLists together, independent of the input lists
+
+        Args:
+            other (UnrolledList[T]): The list to add to current list.
+
+        Raises:
+            TypeError: TypeError raised if other is not an UnrolledList
+
+        Returns:
+            UnrolledList[T]: A new list with the elements of the two lists together
+        """
+        if not isinstance(other, UnrolledList):
+            raise TypeError("`other` must be an UnrolledList")
+        result = self.__copy__()
+        result.extend(other)
+        return result
+
+    def extend(self, elements: Iterable[T]) -> UnrolledList[T]:
+        """Appends every element of an iterable to the end of the list
+
+        Args:
+            elements (Iterable[T]): The elements to be appended
+
+        Returns:
+            UnrolledList[T]: The list after the extend operation.
+        """
+        iterator = iter(elements)
+        tail = self.tail
+        if tail is not None:
+            # Top up the last block before adding new ones
+            chunk = list(islice(iterator, self.block_size - len(tail.elements)))
+            tail.elements.extend(chunk)
+            self.length += len(chunk)
+        while True:
+            chunk = list(islice(iterator, self.block_size))
+            if not chunk:
+                return self
+            self._link_after(self.tail, _Block(chunk))
+            self.length += len(chunk)
+
+    def append(self, element: T) -> UnrolledList[T]:
+        """Appends an element to the end of the list
+
+        Args:
+            element (T): The element to be appended
+
+        Returns:
+            UnrolledList[T]: The list after the append operation.
+        """
+        tail = self.tail
+        if tail is None or len(tail.elements) == self.block_size:
+            self._link_after(tail, _Block([element]))
+        else:
+            tail.elements.append(element)
+        self.length += 1
+        return self
+
+    def prepend(self, element: T) -> UnrolledList[T]:
+        """Prepends an element to the beginning of the list
+
+        Args:
+            element (T): The element to be prepended
+
+        Returns:
+            UnrolledList[T]: The list after the prepend operation.
+        """
+        head = self.head
+        if head is None:
+            self._link_after(None, _Block([element]))
+        else:
+            if len(head.elements) == self.block_size:
+                self._split(head)
+            head.elements.insert(0, element)
+        self.length += 1
+        return self
+
+    def insert(self, element: T, index: int) -> UnrolledList[T]:
+        """Inserts a specified element at the specified index in the list
+
+        Raises:
+            IndexError: raised if the specified index is out of range
+
+        Returns:
+            UnrolledList[T]: The list after the insert operation.
+        """
+        if index > self.length or index < 0:
+            raise IndexError("Index out of range")
+        elif index == self.length:
+            return self.append(element)
+        block, offset = self._locate(index)
+        block.elements.insert(offset, element)
+        self.length += 1
+        if len(block.elements) > self.block_size:
+            self._split(block)
+        return self
+
+    def remove_head(self) -> UnrolledList[T]:
+        """Removes the first element from the list
+
+        Raises:
+            ListIsEmptyError: Raised if the list is empty, and no first element can be removed.
+
+        Returns:
+            UnrolledList[T]: The list after the element is removed.
+        """
+        if self.head is None:
+            raise ListIsEmptyError()
+        return self._remove_at(self.head, 0)
+
+    def remove_tail(self) -> UnrolledList[T]:
+        """Removes the last element from the list.
+
+        Raises:
+            ListIsEmptyError: Raised if the list is empty, and no last element can be removed.
+
+        Returns:
+            UnrolledList[T]: The list after the element is removed.
+        """
+        if self.tail is None:
+            raise ListIsEmptyError()
+        return self._remove_at(self.tail, len(self.tail.elements) - 1)
+
+    def remove_element(self, element: T) -> UnrolledList[T]:
+        """Removes the first occurrence of the specified element from the list.
+
+        Raises:
+            ValueError: Raised if the input element is not in the list and can't be removed.
+
+        Returns:
+            UnrolledList[T]: The list after the element is removed.
+        """
+        return self.remove_nth_occurrence(element, 1)
+
+    def remove_nth_occurrence(self, element: T, n: int) -> UnrolledList[T]:
+        """Removes the nth occurrence of a specified element from the list.
+
+        Args:
+            element (T): The element to look for
+            n (int): int for the nth occurrence to look for
+
+        Raises:
+            ValueError: raised if there are fewer than n occurrences of element in the list
+
+        Returns:
+            UnrolledList[T]: The list after the element is removed.
+        """
+        block, offset = self._find_nth_occurrence(element, n)
+        return self._remove_at(block, offset)
+
+    def remove_all_occurrences(self, element: T) -> UnrolledList[T]:
+        """Removes all occurrences of a specified element from the list.
+
+        Args:
+            element (T): The element to look for
+
+        Returns:
+            UnrolledList[T]: The list after the elements are removed.
+        """
+        block = self.head
+        while block is not None:
+            if element in block.elements:
+                kept = [e for e in block.elements if e != element]
+                self.length -= len(block.elements) - len(kept)
+                block.elements = kept
+            block = block.next
+        # Rebalance once every block is filtered, since merging moves elements between blocks
+        block = self.head
+        while block is not None:
+            if not block.elements:
+                self._unlink(block)
+            else:
+                while (len(block.elements) < self.block_size // 2
+                       and block.next is not None):
+                    self._rebalance(block)
+            block = block.next
+        return self
+
+    def remove_index(self, index: int) -> UnrolledList[T]:
+        """Removes the element at a given index if the index is valid
+
+        Raises:
+            IndexError: Raised if the index is invalid
+
+        Returns:
+            UnrolledList[T]: The list after the element is removed.
+        """
+        if index > self.length - 1 or index < 0:
+            raise IndexError("Index out of range")
+        return self._remove_at(*self._locate(index))
+
+    def get(self, index: int) -> T:
+        """Gets the element at the given index
+
+        Args:
+            index (int): An index in the list
+
+        Raises:
+            IndexError: raised for invalid indices
+
+        Returns:
+            T: The element at the input index if exists.
+        """
+        if index > self.length - 1 or index < 0:
+            raise IndexError("Index out of range")
+        block, offset = self._locate(index)
+        return block.elements[offset]
+
+    def get_tail(self) -> T:
+        """Gets the last element in the list.
+
+        Raises:
+            ListIsEmptyError: raised if the list is empty.
+
+        Returns:
+            T: The last element in the list
+        """
+        if self.tail is None:
+            raise ListIsEmptyError("The list is empty.")
+        return self.tail.elements[-1]
+
+    def get_nth_occurrence(self, element: T, n: int) -> T:
+        """Gets the nth occurrence of the element
+
+        Args:
+            element (T): The element to look for
+            n (int): int for the nth occurrence to look for
+
+        Raises:
+            ValueError: raised if there are fewer than n occurrences of element in the list
+
+        Returns:
+            T: The element stored at the nth occurrence, if found in the list
+        """
+        block, offset = self._find_nth_occurrence(element, n)
+        return block.elements[offset]
+
+    def index_of(self, element: T) -> int:
+        """Finds the index of the first occurence of element param in the list
+
+        Args:
+            element (T): The type T element to look for.
+
+        Raises:
+            ValueError: raised if the element not in list
+
+        Returns:
+            int: The index of the first occurence of element if found
+        """
+        start = 0
+        block = self.head
+        while block is not None:
+            if element in block.elements:
+                return start + block.elements.index(element)
+            start += len(block.elements)
+            block = block.next
+        raise ValueError("`element` does not exist in the list")
+
+    def count_occurrences(self, element: T) -> int:
+        """Counts the number of occurrences of element in the list.
+
+        Args:
+            element (T): The element to look for
+
+        Returns:
+            int: The num occurrences of element found
+        """
+        count = 0
+        block = self.head
+        while block is not None:
+            count += block.elements.count(element)
+            block = block.next
+        return count
+
+    def get_many(self, indices: Iterable[int]) -> List[T]:
+        """Gets the elements at many indices in a single pass over the blocks.
+
+        Args:
+            indices (Iterable[int]): Indices in the list, in any order.
+
+        Raises:
+            IndexError: raised if any index is invalid
+
+        Returns:
+            List[T]: The element at each index, in the order of the input indices.
+        """
+        indices = list(indices)
+        for index in indices:
+            if index > self.length - 1 or index < 0:
+                raise IndexError("Index out of range")
+        values: Dict[int, T] = {}
+        block = self.head
+        start = 0
+        for index in sorted(set(indices)):
+            while index >= start + len(block.elements):
+                start += len(block.elements)
+                block = block.next
+            values[index] = block.elements[index - start]
+        return [values[index] for index in indices]
+
+    def _find_first_indices(self, elements: List[T]) -> Dict[T, int]:
+        """Helper method for index_of_many and contains_many. Finds the first index of each element.
+
+        Each block is matched against the remaining elements with a C-level set intersection.
+
+        Args:
+            elements (List[T]): The hashable elements to look for.
+
+        Returns:
+            Dict[T, int]: The index of the first occurrence of each element found in the list.
+        """
+        remaining = set(elements)
+        found: Dict[T, int] = {}
+        block = self.head
+        start = 0
+        while remaining and block is not None:
+            try:
+                hits = remaining.intersection(block.elements)
+            except TypeError:
+                # The block holds unhashable elements, so compare them one by one
+                hits = {e for e in remaining if e in block.elements}
+            for element in hits:
+                found[element] = start + block.elements.index(element)
+            remaining -= hits
+            start += len(block.elements)
+            block = block.next
+        return found
+
+    def reverse(self) -> UnrolledList[T]:
+        """Reverses the list in place by reversing each block and the order of the blocks.
+
+        Returns:
+            UnrolledList[T]: The reversed list.
+        """
+        block = self.head
+        while block is not None:
+            block.elements.reverse()
+            block.prev, block.next = block.next, block.prev
+            block = block.prev
+        self.head, self.tail = self.tail, self.head
+        # The old tail block may be less than half full, and is now the head
+        if self.head is not None:
+            self._rebalance(self.head)
+        return self
+
+    def rotate(self, k: int) -> UnrolledList[T]:
+        """Rotates the list k steps to the right in place, like collections.deque.rotate.
+
+        Args:
+            k (int): The number of steps; negative values rotate to the left.
+
+        Returns:
+            UnrolledList[T]: The rotated list.
+        """
+        if self.length == 0 or k % self.length == 0:
+            return self
+        # The first block of the elements that move to the front of the list
+        first = self._cut(-k % self.length)
+        old_head, old_tail, new_tail = self.head, self.tail, first.prev
+        new_tail.next = None
+        first.prev = None
+        old_tail.next = old_head
+        old_head.prev = old_tail
+        self.head, self.tail = first, new_tail
+        # The blocks at the old ends of the list and at the cut may be small
+        self._rebalance(old_tail)
+        self._rebalance(first)
+        return self
+
+    def split_at(self, index: int) -> Tuple[UnrolledList[T], UnrolledList[T]]:
+        """Splits the list in place into the elements before index and the rest.
+
+        Args:
+            index (int): The index of the first element of the second list.
+
+        Raises:
+            IndexError: raised if index is not between 0 and the size of the list
+
+        Returns:
+            Tuple[UnrolledList[T], UnrolledList[T]]: This list, truncated to the elements
+            before index, and a new list holding the blocks of the rest.
+        """
+        if index > self.length or index < 0:
+            raise IndexError("Index out of range")
+        second: UnrolledList[T] = UnrolledList((), self.block_size)
+        first = self._cut(index)
+        if first is not None:
+            second.head, second.tail = first, self.tail
+            second.length = self.length - index
+            self.tail = first.prev
+            if first.prev is None:
+                self.head = None
+            else:
+                first.prev.next = None
+                first.prev = None
+            self.length = index
+            # The cut may have left a small block at the head of the second list
+            second._rebalance(first)
+        return self, second
+
+    def drop(self, n: int) -> UnrolledList[T]:
+        """Drops the first n elements of the list in place.
+
+        Args:
+            n (int): The number of elements to drop.
+
+        Raises:
+            IndexError: raised if n is not between 0 and the size of the list
+
+        Returns:
+            UnrolledList[T]: The list after the first n elements are dropped.
+        """
+        rest = self.split_at(n)[1]
+        self.head, self.tail, self.length = rest.head, rest.tail, rest.length
+        return self
+
+    def _blocks(self) -> Iterator[_Block]:
+        """Iterates over the blocks of the list in order.
+
+        Returns:
+            Iterator[_Block]: An iterator over the blocks.
+        """
+        block = self.head
+        while block is not None:
+            yield block
+            block = block.next
+
+    def _locate(self, index: int) -> Tuple[_Block, int]:
+        """Finds the block holding a valid index, walking from the nearer end of the list.
+
+        Args:
+            index (int): An index in the list
+
+        Returns:
+            Tuple[_Block, int]: The block and the offset of the index within it.
+        """
+        if index < self.length // 2:
+            block = self.head
+            while index >= len(block.elements):
+                index -= len(block.elements)
+                block = block.next
+            return block, index
+        index -= self.length
+        block = self.tail
+        while -index > len(block.elements):
+            index += len(block.elements)
+            block = block.prev
+        return block, len(block.elements) + index
+
+    def _cut(self, index: int) -> Optional[_Block]:
+        """Splits the block holding an index, so that the index starts a block.
+
+        Args:
+            index (int): An index in the list, or the size of the list
+
+        Returns:
+            Optional[_Block]: The block starting at index, or None if index is the size of the list.
+        """
+        if index == self.length:
+            return None
+        block, offset = self._locate(index)
+        if offset:
+            self._link_after(block, _Block(block.elements[offset:]))
+            del block.elements[offset:]
+            block = block.next
+        return block
+
+    def _find_nth_occurrence(self, element: T, n: int) -> Tuple[_Block, int]:
+        """Finds the block and offset of the nth occurrence of an element.
+
+        Args:
+            element (T): The element to look for
+            n (int): int for the nth occurrence to look for
+
+        Raises:
+            ValueError: raised if there are fewer than n occurrences of element in the list
+
+        Returns:
+            Tuple[_Block, int]: The block and the offset of the occurrence within it.
+        """
+        block = self.head
+        while block is not None and n > 0:
+            count = block.elements.count(element)
+            if count >= n:
+                offset = -1
+                for _ in range(n):
+                    offset = block.elements.index(element, offset + 1)
+                return block, offset
+            n -= count
+            block = block.next
+        if n == 1:
+            raise ValueError("`element` does not exist in the list")
+        raise ValueError(
+            "There are fewer than `n` occurrences `element` in the list")
+
+    def _remove_at(self, block: _Block, offset: int) -> UnrolledList[T]:
+        """Removes the element at an offset within a block, then rebalances the block.
+
+        Args:
+            block (_Block): The block holding the element
+            offset (int): The offset of the element within the block
+
+        Returns:
+            UnrolledList[T]: The list after the element is removed.
+        """
+        del block.elements[offset]
+        self.length -= 1
+        self._rebalance(block)
+        return self
+
+    def _rebalance(self, block: _Block) -> None:
+        """Restores the size invariant of a block that may have dropped below half full.
+
+        An empty block is unlinked. A block below half full is merged with its successor
+        if they fit in one block, otherwise it takes elements from its successor until
+        both are about equally full.
+
+        Args:
+            block (_Block): The block to rebalance
+        """
+        elements = block.elements
+        if not elements:
+            self._unlink(block)
+            return
+        successor = block.next
+        if len(elements) >= self.block_size // 2 or successor is None:
+            return
+        if len(elements) + len(successor.elements) <= self.block_size:
+            elements.extend(successor.elements)
+            self._unlink(successor)
+        else:
+            moved = (len(successor.elements) - len(elements)) // 2
+            elements.extend(successor.elements[:moved])
+            del successor.elements[:moved]
+
+    def _split(self, block: _Block) -> None:
+        """Moves the second half of an overflowing block into a new block after it.
+
+        Args:
+            block (_Block): The block to split
+        """
+        half = len(block.elements) // 2
+        self._link_after(block, _Block(block.elements[half:]))
+        del block.elements[half:]
+
+    def _link_after(self, block: Optional[_Block], new: _Block) -> None:
+        """Links a new block after a block, or at the head of the list if block is None.
+
+        Args:
+            block (Optional[_Block]): The block to link after
+            new (_Block): The block to link
+        """
+        new.prev = block
+        new.next = self.head if block is None else block.next
+        if new.next is None:
+            self.tail = new
+        else:
+            new.next.prev = new
+        if block is None:
+            self.head = new
+        else:
+            block.next = new
+
+    def _unlink(self, block: _Block) -> None:
+        """Unlinks a block from the list, leaving its own prev and next references intact.
+
+        Args:
+            block (_Block): The block to unlink
+        """
+        if block.prev is None:
+            self.head = block.next
+        else:
+            block.prev.next = block.next
+        if block.next is None:
+            self.tail = block.prev
+        else:
+            block.next.prev = block.prev
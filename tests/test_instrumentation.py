@@ -0,0 +1,75 @@
+import sys
+
+from py_polymorphic_list import EmptyList, UnrolledList, instrumentation
+
+
+def test_reset_keeps_recording():
+    lst = EmptyList().prepend(2).prepend(1)
+    with instrumentation.instrument() as stats:
+        lst.get(1)
+        stats.reset()
+        assert stats["NonEmptyList", "get"].calls == 0
+        lst.get(1)
+    assert stats["NonEmptyList", "get"].calls == 1
+
+
+def test_stats_are_keyed_by_class():
+    lst = EmptyList().prepend(1)
+    with instrumentation.instrument() as stats:
+        lst.get(0)
+        EmptyList().prepend(1).remove_head()
+    assert stats["NonEmptyList", "get"].calls == 1
+    assert stats["EmptyList", "prepend"].calls == 1
+    assert stats["EmptyList", "get"].calls == 0
+    assert 'class="NonEmptyList",method="get"} 1' in stats.to_prometheus()
+
+
+def test_nodes_visited_counts_recursive_invocations_only():
+    lst = EmptyList().prepend(3).prepend(2).prepend(1)
+    with instrumentation.instrument() as stats:
+        lst.get(2)
+        lst = lst.reverse()
+    assert stats["NonEmptyList", "get"].nodes_visited == 3
+    assert stats["NonEmptyList", "reverse"].calls == 1
+    assert stats["NonEmptyList", "reverse"].nodes_visited is None
+    assert "nodes_visited_total{class=\"NonEmptyList\",method=\"reverse\"}" \
+        not in stats.to_prometheus()
+
+
+def test_nodes_visited_is_not_counted_for_batch_lookups():
+    lst = EmptyList().prepend(3).prepend(2).prepend(1)
+    with instrumentation.instrument() as stats:
+        lst.get_many([0, 2])
+        lst.contains_many([3])
+    assert stats["NonEmptyList", "get_many"].calls == 1
+    assert stats["NonEmptyList", "get_many"].nodes_visited is None
+    assert stats["NonEmptyList", "contains_many"].nodes_visited is None
+
+
+def test_inherited_methods_are_keyed_by_the_class_of_the_list():
+    lst = EmptyList().prepend(1)
+    with instrumentation.instrument() as stats:
+        lst.size()
+        EmptyList().size()
+        UnrolledList([1, 2]).get_many([1])
+    assert stats["NonEmptyList", "size"].calls == 1
+    assert stats["EmptyList", "size"].calls == 1
+    assert stats["UnrolledList", "get_many"].calls == 1
+    assert stats["UnrolledList", "get_many"].nodes_visited is None
+    assert ("PolymorphicList", "size") not in stats.methods
+
+
+def test_instrumented_recursion_depth():
+    # Longer than half the recursion limit, but short enough to work uninstrumented
+    limit = sys.getrecursionlimit()
+    size = limit * 3 // 5
+    lst = EmptyList()
+    for i in range(size):
+        lst = lst.prepend(i)
+    with instrumentation.instrument() as stats:
+        assert lst.index_of(0) == size - 1
+        assert lst.count_occurrences(0) == 1
+        lst = lst.append(size)
+        assert str(lst).endswith(f"0 -> {size}")
+    assert stats["NonEmptyList", "index_of"].nodes_visited == size
+    assert sys.getrecursionlimit() == limit
@@ -0,0 +1,146 @@
+import random
+
+import pytest
+
+from py_polymorphic_list import EmptyList, NodePool, instrumentation
+from py_polymorphic_list.polymorphic_list import NonEmptyList
+
+
+def elements(lst):
+    result = []
+    while not isinstance(lst, EmptyList):
+        result.append(lst.data)
+        lst = lst.next
+    return result
+
+
+def test_held_node_is_not_reused():
+    with NodePool() as pool:
+        lst = EmptyList().prepend(3).prepend(2).prepend(1)
+        held = lst.get(1)
+        lst = lst.remove_index(1)
+        for i in range(10):
+            lst = lst.prepend(i)
+        assert held.data == 2
+        assert held.next.data == 3
+        assert pool.rejected == 1
+        assert pool.hits == 0
+
+
+def test_unreferenced_nodes_are_reused():
+    with NodePool() as pool:
+        lst = EmptyList().prepend(2).prepend(1)
+        lst = lst.remove_head().remove_head()
+        assert len(pool) == 2
+        lst = lst.prepend(3).prepend(4).prepend(5)
+        assert elements(lst) == [5, 4, 3]
+        assert (pool.hits, pool.misses, pool.rejected) == (2, 3, 0)
+        assert len(pool) == 0
+
+
+def test_max_size_bounds_the_pool():
+    with NodePool(max_size=2) as pool:
+        lst = EmptyList()
+        for i in range(5):
+            lst = lst.prepend(i)
+        while not isinstance(lst, EmptyList):
+            lst = lst.remove_head()
+        assert len(pool) == 2
+        pool.shrink(1)
+        assert len(pool) == 1
+    assert len(pool) == 0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_python_list(seed):
+    rng = random.Random(seed)
+    lst, expected = EmptyList(), []
+    held = []
+    with NodePool(max_size=16) as pool:
+        for _ in range(1000):
+            # A new object per element, so that held nodes can be checked by identity
+            element = [rng.randrange(6)]
+            name = rng.choice([
+                "prepend", "append", "insert", "remove_head", "remove_tail",
+                "remove_element", "remove_nth_occurrence",
+                "remove_all_occurrences", "remove_index", "hold"
+            ])
+            if name == "prepend":
+                lst = lst.prepend(element)
+                expected.insert(0, element)
+            elif name == "append":
+                lst = lst.append(element)
+                expected.append(element)
+            elif name == "insert" and expected:
+                index = rng.randint(0, len(expected))
+                lst = lst.insert(element, index)
+                expected.insert(index, element)
+            elif name == "remove_head" and expected:
+                lst = lst.remove_head()
+                del expected[0]
+            elif name == "remove_tail" and expected:
+                lst = lst.remove_tail()
+                del expected[-1]
+            elif name == "remove_element" and element in expected:
+                lst = lst.remove_element(element)
+                expected.remove(element)
+            elif name == "remove_nth_occurrence" and element in expected:
+                n = rng.randint(1, expected.count(element))
+                lst = lst.remove_nth_occurrence(element, n)
+                indices = [i for i, e in enumerate(expected) if e == element]
+                del expected[indices[n - 1]]
+            elif name == "remove_all_occurrences":
+                lst = lst.remove_all_occurrences(element)
+                expected[:] = [e for e in expected if e != element]
+            elif name == "remove_index" and expected:
+                index = rng.randrange(len(expected))
+                lst = lst.remove_index(index)
+                del expected[index]
+            elif name == "hold" and expected:
+                # Held nodes must keep their data and the rest of their list
+                node = lst.get(rng.randrange(len(expected)))
+                held.append((node, node.data))
+            assert elements(lst) == expected
+            assert lst.length == len(expected)
+        assert pool.hits > 0
+    for node, data in held:
+        assert node.data is data
+
+
+def test_install_and_uninstall_restore_the_methods():
+    originals = {
+        name: NonEmptyList.__dict__[name]
+        for name in ("prepend", "insert", "remove_head", "remove_tail")
+    }
+    empty_append = EmptyList.__dict__["append"]
+    pool = NodePool()
+    pool.install()
+    try:
+        assert NonEmptyList.__dict__["prepend"] is not originals["prepend"]
+        with pytest.raises(RuntimeError):
+            NodePool().install()
+    finally:
+        pool.uninstall()
+    for name, method in originals.items():
+        assert NonEmptyList.__dict__[name] is method
+    assert EmptyList.__dict__["append"] is empty_append
+
+
+def test_install_after_instrumentation_raises():
+    with instrumentation.instrument():
+        with pytest.raises(RuntimeError):
+            NodePool().install()
+    NodePool().uninstall()
+
+
+def test_uninstall_while_instrumented_raises():
+    pool = NodePool()
+    pool.install()
+    try:
+        with instrumentation.instrument():
+            with pytest.raises(RuntimeError):
+                pool.uninstall()
+    finally:
+        pool.uninstall()
+    assert NonEmptyList.__dict__["prepend"].__module__.endswith(
+        "polymorphic_list")
@@ -0,0 +1,114 @@
+import pytest
+
+from py_polymorphic_list import EmptyList
+
+
+def build(elements):
+    lst = EmptyList()
+    for element in reversed(elements):
+        lst = lst.prepend(element)
+    return lst
+
+
+def check(lst, expected):
+    """Checks the data of every node, and that each node's length counts the rest."""
+    data, lengths = [], []
+    node = lst
+    while not isinstance(node, EmptyList):
+        data.append(node.data)
+        lengths.append(node.length)
+        node = node.next
+    assert data == expected
+    assert lengths == list(range(len(expected), 0, -1))
+    assert lst.length == len(expected)
+
+
+@pytest.mark.parametrize("size", [1, 2, 7])
+def test_reverse(size):
+    elements = list(range(size))
+    check(build(elements).reverse(), elements[::-1])
+
+
+def test_reverse_empty():
+    check(EmptyList().reverse(), [])
+
+
+@pytest.mark.parametrize("k", [-15, -8, -7, -3, -1, 0, 1, 3, 7, 8, 15])
+def test_rotate(k):
+    elements = list(range(7))
+    cut = len(elements) - k % len(elements)
+    check(build(elements).rotate(k), elements[cut:] + elements[:cut])
+
+
+@pytest.mark.parametrize("index", [0, 1, 6, 7])
+def test_split_at(index):
+    elements = list(range(7))
+    first, second = build(elements).split_at(index)
+    check(first, elements[:index])
+    check(second, elements[index:])
+
+
+@pytest.mark.parametrize("n", [0, 1, 6, 7])
+def test_take_and_drop(n):
+    elements = list(range(7))
+    check(build(elements).take(n), elements[:n])
+    check(build(elements).drop(n), elements[n:])
+
+
+@pytest.mark.parametrize("index", [-1, 8])
+def test_split_at_out_of_range(index):
+    with pytest.raises(IndexError):
+        build(list(range(7))).split_at(index)
+
+
+def test_contains_many_with_unhashable_data():
+    lst = build([[1], 2, 3])
+    assert lst.contains_many([2]) == [True]
+    assert lst.contains_many([3, 4]) == [True, False]
+
+
+def test_index_of_many_with_unhashable_data():
+    lst = build([[1], 2, [3], 2])
+    assert lst.index_of_many([2]) == [1]
+
+
+def test_get_many_returns_nodes_in_input_order():
+    lst = build([10, 11, 12, 13, 14])
+    nodes = lst.get_many([3, 0, 3, 4, 1])
+    assert [node.data for node in nodes] == [13, 10, 13, 14, 11]
+    assert nodes[0] is nodes[2] is lst.get(3)
+    assert lst.get_many([]) == []
+
+
+@pytest.mark.parametrize("indices", [[5], [0, -1], [2, 7]])
+def test_get_many_out_of_range(indices):
+    with pytest.raises(IndexError):
+        build([10, 11, 12, 13, 14]).get_many(indices)
+
+
+def test_index_of_many_returns_first_indices_in_input_order():
+    lst = build(["a", "b", "a", "c"])
+    assert lst.index_of_many(["c", "a", "b", "a"]) == [3, 0, 1, 0]
+    assert lst.index_of_many([]) == []
+
+
+def test_index_of_many_missing_element():
+    with pytest.raises(ValueError):
+        build(["a", "b"]).index_of_many(["b", "z"])
+
+
+def test_contains_many_in_input_order():
+    lst = build(["a", "b", "a", "c"])
+    assert lst.contains_many(["z", "c", "a", "z"]) == [False, True, True, False]
+    assert lst.contains_many([]) == []
+
+
+def test_batch_lookups_on_empty_list():
+    lst = EmptyList()
+    assert lst.get_many([]) == []
+    with pytest.raises(IndexError):
+        lst.get_many([0])
+    assert lst.index_of_many([]) == []
+    with pytest.raises(ValueError):
+        lst.index_of_many(["a"])
+    assert lst.contains_many(["a", "b"]) == [False, False]
@@ -0,0 +1,125 @@
+import io
+import struct
+
+import pytest
+
+from py_polymorphic_list import EmptyList, streaming
+
+TEXTS = [
+    "",
+    "a",
+    "a\n",
+    "a\nbc\n\ndef",
+    "a\r\nbc\r\n\r\ndef\r\n",
+    "a\n\n",
+    "\n\n\n",
+    "mixed\r\nline\nends\r\n",
+]
+RECORD = struct.Struct("<hi")
+
+
+def elements(lst):
+    result = []
+    while not isinstance(lst, EmptyList):
+        assert lst.length == lst.next.length + 1
+        result.append(lst.data)
+        lst = lst.next
+    return result
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 64])
+@pytest.mark.parametrize("text", TEXTS)
+def test_load_lines_from_text_file(text, chunk_size):
+    lst = streaming.load_lines(io.StringIO(text), chunk_size=chunk_size)
+    assert elements(lst) == text.splitlines()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 64])
+@pytest.mark.parametrize("text", TEXTS)
+def test_load_lines_from_binary_file(text, chunk_size):
+    data = text.encode()
+    lst = streaming.load_lines(io.BytesIO(data), chunk_size=chunk_size)
+    assert elements(lst) == data.splitlines()
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_load_lines_from_iterable(text):
+    lines = text.splitlines(keepends=True)
+    assert elements(streaming.load_lines(lines)) == text.splitlines()
+
+
+def test_load_lines_parse():
+    lst = streaming.load_lines(io.StringIO("1\n2\n3\n"), parse=int, chunk_size=2)
+    assert elements(lst) == [1, 2, 3]
+
+
+def test_max_elements_does_not_over_consume():
+    lines = iter(["a\n", "b\n", "c\n", "d\n"])
+    lst = streaming.load_lines(lines, max_elements=2)
+    assert elements(lst) == ["a", "b"]
+    assert next(lines) == "c\n"
+
+
+def test_max_elements_zero_and_negative():
+    assert elements(streaming.load_lines(io.StringIO("a\nb\n"), max_elements=0)) == []
+    with pytest.raises(ValueError):
+        streaming.load_lines(io.StringIO("a\n"), max_elements=-1)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 64])
+def test_load_records(chunk_size):
+    values = [(i, i * 1000) for i in range(-3, 7)]
+    data = b"".join(RECORD.pack(*value) for value in values)
+    lst = streaming.load_records(io.BytesIO(data), RECORD.size,
+                                 parse=RECORD.unpack, chunk_size=chunk_size)
+    assert elements(lst) == values
+
+
+def test_load_records_max_elements():
+    data = b"".join(RECORD.pack(i, i) for i in range(5))
+    lst = streaming.load_records(io.BytesIO(data), RECORD.size,
+                                 parse=RECORD.unpack, max_elements=3)
+    assert elements(lst) == [(0, 0), (1, 1), (2, 2)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 64])
+def test_load_records_partial_trailing_record(chunk_size):
+    data = RECORD.pack(1, 2) + b"\x00\x01"
+    with pytest.raises(ValueError):
+        streaming.load_records(io.BytesIO(data), RECORD.size,
+                               chunk_size=chunk_size)
+
+
+def test_load_records_invalid_record_size():
+    with pytest.raises(ValueError):
+        streaming.load_records(io.BytesIO(b""), 0)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 64])
+def test_dump_and_load_lines_round_trip(chunk_size):
+    values = [0, 12, -3, 456, 7]
+    lst = streaming.load_lines([f"{value}\n" for value in values], parse=int)
+    file = io.StringIO()
+    assert streaming.dump_lines(lst, file, chunk_size=chunk_size) == len(values)
+    file.seek(0)
+    lst = streaming.load_lines(file, parse=int, chunk_size=chunk_size)
+    assert elements(lst) == values
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 64])
+def test_dump_and_load_records_round_trip(chunk_size):
+    values = [(i, i * 7) for i in range(6)]
+    file = io.BytesIO()
+    count = streaming.dump_records(values, file, lambda v: RECORD.pack(*v),
+                                   chunk_size=chunk_size)
+    assert count == len(values)
+    file.seek(0)
+    lst = streaming.load_records(file, RECORD.size, parse=RECORD.unpack,
+                                 chunk_size=chunk_size)
+    assert elements(lst) == values
+
+
+def test_dump_lines_empty_list():
+    file = io.StringIO()
+    assert streaming.dump_lines(EmptyList(), file) == 0
+    assert file.getvalue() == ""
@@ -0,0 +1,159 @@
+import random
+
+import pytest
+
+from py_polymorphic_list import UnrolledList
+
+
+def check(lst, expected):
+    """Checks the elements, the length and the block invariants of an UnrolledList."""
+    assert list(lst) == expected
+    assert lst.length == len(expected)
+    elements = []
+    prev = None
+    block = lst.head
+    while block is not None:
+        assert block.prev is prev
+        assert 0 < len(block.elements) <= lst.block_size
+        if block is not lst.tail:
+            assert len(block.elements) >= lst.block_size // 2
+        elements.extend(block.elements)
+        prev, block = block, block.next
+    assert lst.tail is prev
+    assert elements == expected
+
+
+def random_operation(rng, lst, expected):
+    """Applies a random operation to both an UnrolledList and a Python list."""
+    element = rng.randrange(8)
+    index = rng.randint(0, len(expected))
+    name = rng.choice([
+        "append", "prepend", "insert", "extend", "remove_head", "remove_tail",
+        "remove_element", "remove_nth_occurrence", "remove_all_occurrences",
+        "remove_index", "reverse", "rotate", "split_at", "take", "drop"
+    ])
+    if name == "append":
+        lst = lst.append(element)
+        expected.append(element)
+    elif name == "prepend":
+        lst = lst.prepend(element)
+        expected.insert(0, element)
+    elif name == "insert":
+        lst = lst.insert(element, index)
+        expected.insert(index, element)
+    elif name == "extend":
+        elements = [rng.randrange(8) for _ in range(rng.randrange(12))]
+        lst = lst.extend(elements)
+        expected.extend(elements)
+    elif name == "remove_head" and expected:
+        lst = lst.remove_head()
+        del expected[0]
+    elif name == "remove_tail" and expected:
+        lst = lst.remove_tail()
+        del expected[-1]
+    elif name == "remove_element" and element in expected:
+        lst = lst.remove_element(element)
+        expected.remove(element)
+    elif name == "remove_nth_occurrence" and element in expected:
+        n = rng.randint(1, expected.count(element))
+        lst = lst.remove_nth_occurrence(element, n)
+        del expected[[i for i, e in enumerate(expected) if e == element][n - 1]]
+    elif name == "remove_all_occurrences":
+        lst = lst.remove_all_occurrences(element)
+        expected[:] = [e for e in expected if e != element]
+    elif name == "remove_index" and expected:
+        index = rng.randrange(len(expected))
+        lst = lst.remove_index(index)
+        del expected[index]
+    elif name == "reverse":
+        lst = lst.reverse()
+        expected.reverse()
+    elif name == "rotate":
+        k = rng.randint(-2 * len(expected) - 1, 2 * len(expected) + 1)
+        lst = lst.rotate(k)
+        if expected:
+            cut = len(expected) - k % len(expected)
+            expected[:] = expected[cut:] + expected[:cut]
+    elif name == "split_at":
+        lst, second = lst.split_at(index)
+        check(second, expected[index:])
+        del expected[index:]
+    elif name == "take":
+        lst = lst.take(index)
+        del expected[index:]
+    elif name == "drop":
+        lst = lst.drop(index)
+        del expected[:index]
+    return lst
+
+
+@pytest.mark.parametrize("block_size", [2, 3, 4, 5, 6])
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_python_list(block_size, seed):
+    rng = random.Random(seed)
+    expected = [rng.randrange(8) for _ in range(rng.randrange(20))]
+    lst = UnrolledList(expected, block_size)
+    check(lst, expected)
+    for _ in range(500):
+        lst = random_operation(rng, lst, expected)
+        check(lst, expected)
+
+
+def test_reverse_rebalances_the_new_head():
+    lst = UnrolledList(range(9), block_size=4).reverse()
+    assert list(lst) == list(range(8, -1, -1))
+    assert len(lst.head.elements) >= 2
+
+
+@pytest.mark.parametrize("block_size", [2, 3, 4])
+def test_get_many_returns_elements_in_input_order(block_size):
+    lst = UnrolledList([10, 11, 12, 13, 14], block_size)
+    assert lst.get_many([3, 0, 3, 4, 1]) == [13, 10, 13, 14, 11]
+    assert lst.get_many([]) == []
+
+
+@pytest.mark.parametrize("indices", [[5], [0, -1], [2, 7]])
+def test_get_many_out_of_range(indices):
+    with pytest.raises(IndexError):
+        UnrolledList([10, 11, 12, 13, 14], 2).get_many(indices)
+
+
+@pytest.mark.parametrize("block_size", [2, 3, 4])
+def test_index_of_many_returns_first_indices_in_input_order(block_size):
+    lst = UnrolledList(["a", "b", "a", "c"], block_size)
+    assert lst.index_of_many(["c", "a", "b", "a"]) == [3, 0, 1, 0]
+    assert lst.index_of_many([]) == []
+
+
+def test_index_of_many_missing_element():
+    with pytest.raises(ValueError):
+        UnrolledList(["a", "b"], 2).index_of_many(["b", "z"])
+
+
+@pytest.mark.parametrize("block_size", [2, 3, 4])
+def test_contains_many_in_input_order(block_size):
+    lst = UnrolledList(["a", "b", "a", "c"], block_size)
+    assert lst.contains_many(["z", "c", "a", "z"]) == [False, True, True, False]
+    assert lst.contains_many([]) == []
+
+
+def test_batch_lookups_on_empty_list():
+    lst = UnrolledList()
+    assert lst.get_many([]) == []
+    with pytest.raises(IndexError):
+        lst.get_many([0])
+    assert lst.index_of_many([]) == []
+    with pytest.raises(ValueError):
+        lst.index_of_many(["a"])
+    assert lst.contains_many(["a", "b"]) == [False, False]
+
+
+def test_contains_many_with_unhashable_data():
+    lst = UnrolledList([[1], 2, 3], block_size=2)
+    assert lst.contains_many([2]) == [True]
+    assert lst.contains_many([3, 4]) == [True, False]
+
+
+def test_index_of_many_with_unhashable_data():
+    lst = UnrolledList([[1], 2, [3], 2], block_size=2)
+    assert lst.index_of_many([2]) == [1]